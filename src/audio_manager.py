@@ -1,8 +1,12 @@
 """
 Audio management for Nina's Beats.
 
-Handles audio playback via mpv subprocess and time tracking for synchronization.
+Handles audio playback via libmpv (python-mpv) when available, falling back
+to an mpv subprocess, and time tracking for synchronization.
 """
+import os
+import select
+import signal
 import subprocess
 import time
 import shutil
@@ -10,8 +14,17 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+try:
+    import mpv  # Optional: python-mpv embeds libmpv in-process
+except (ImportError, OSError):
+    # Not installed, or libmpv shared library missing
+    mpv = None
 
-@dataclass
+# Opened once and shared by every mpv spawn (stdin/stdout/stderr)
+_DEVNULL_FD = os.open(os.devnull, os.O_RDWR)
+
+
+@dataclass(slots=True)
 class AudioState:
     """Current state of audio playback."""
     is_playing: bool = False
@@ -22,7 +35,7 @@ class AudioState:
 
 
 class AudioManager:
-    """Manages audio playback via mpv subprocess."""
+    """Manages audio playback via libmpv, or an mpv subprocess as fallback."""
 
     def __init__(self, audio_path: Path):
         """
@@ -35,14 +48,27 @@ class AudioManager:
             FileNotFoundError: If audio file doesn't exist
         """
         self.audio_path = audio_path
+        self.player = None  # In-process libmpv player (python-mpv)
         self.process: Optional[subprocess.Popen] = None
-        self.start_time: float = 0.0
-        self.pause_start: float = 0.0
-        self.total_paused: float = 0.0
+        self._pid: Optional[int] = None  # Cached for direct os.kill() signalling
+        self._pidfd: Optional[int] = None  # Linux pidfd for event-driven exit wait
+        # Clock bookkeeping in integer monotonic nanoseconds (subprocess path)
+        self.start_ns: int = 0
+        self.pause_start_ns: int = 0
+        self.total_paused_ns: int = 0
+        # Last decoder position and when it was read (libmpv path); carries
+        # the clock on once the player goes idle at EOF
+        self._last_pos: float = 0.0
+        self._last_pos_ns: int = 0
         self.state = AudioState()
 
-        # Verify mpv is available
-        self._mpv_available = shutil.which("mpv") is not None
+        # Prefer libmpv; the subprocess fallback needs the mpv binary
+        if mpv is not None:
+            try:
+                self.player = mpv.MPV(video=False, really_quiet=True)
+            except Exception as e:
+                self._log_error(f"Failed to initialize libmpv: {e}")
+                self.player = None
 
     def start(self) -> AudioState:
         """
@@ -52,17 +78,30 @@ class AudioManager:
             AudioState with is_playing=True, current_time=0.0
 
         Behavior:
-        - Launches mpv in subprocess with --no-video --really-quiet
-        - Records wall clock start time for time tracking
+        - Plays through libmpv if available (decoder reports position)
+        - Otherwise launches mpv in subprocess with --no-video --really-quiet
+          and records the clock start time for time tracking
         - If mpv not found, sets has_error=True but doesn't raise
         """
-        if not self._mpv_available:
+        # Verify mpv is available (only the subprocess fallback needs the binary)
+        if self.player is None and shutil.which("mpv") is None:
             self.state.has_error = True
             return self.state
 
         if not self.audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {self.audio_path}")
 
+        if self.player:
+            try:
+                self.player.play(str(self.audio_path))
+                self.state.is_playing = True
+                self.state.is_paused = False
+                self.state.has_error = False
+            except Exception as e:
+                self.state.has_error = True
+                self._log_error(f"Failed to start libmpv playback: {e}")
+            return self.state
+
         try:
             self.process = subprocess.Popen([
                 "mpv",
@@ -72,10 +111,16 @@ class AudioManager:
                 "--pause=no",
                 "--loop=no",
                 str(self.audio_path)
-            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
+            ], stdout=_DEVNULL_FD, stderr=_DEVNULL_FD, stdin=_DEVNULL_FD)
+            self._pid = self.process.pid
+            try:
+                self._pidfd = os.pidfd_open(self._pid)
+            except (AttributeError, OSError):
+                # Not Linux >= 5.3 / Python >= 3.9; stop() falls back to wait()
+                self._pidfd = None
 
-            self.start_time = time.time()
-            self.total_paused = 0.0
+            self.start_ns = time.monotonic_ns()
+            self.total_paused_ns = 0
             self.state.is_playing = True
             self.state.is_paused = False
             self.state.has_error = False
@@ -95,17 +140,26 @@ class AudioManager:
             AudioState with is_paused=True
 
         Behavior:
-        - Sends SIGSTOP to mpv process
-        - Records pause start time for drift correction
+        - libmpv: sets the player's pause property
+        - Subprocess: sends SIGSTOP to mpv process and records pause
+          start time for drift correction
         - If process not running, no-op
         """
-        if self.process and self._mpv_available:
+        if self.player:
             try:
-                self.process.send_signal(18)  # SIGSTOP
-                self.pause_start = time.time()
+                self.player.pause = True
                 self.state.is_paused = True
             except Exception:
                 pass
+            return self.state
+
+        if self.process:
+            try:
+                os.kill(self._pid, signal.SIGSTOP)
+                self.pause_start_ns = time.monotonic_ns()
+                self.state.is_paused = True
+            except OSError:
+                pass
 
         return self.state
 
@@ -117,19 +171,28 @@ class AudioManager:
             AudioState with is_paused=False
 
         Behavior:
-        - Sends SIGCONT to mpv process
-        - Adds pause duration to total_paused
+        - libmpv: clears the player's pause property
+        - Subprocess: sends SIGCONT to mpv process and adds pause
+          duration to total_paused_ns
         - If process not running, no-op
         """
-        if self.process and self._mpv_available:
+        if self.player:
             try:
-                self.process.send_signal(19)  # SIGCONT
-                if self.pause_start > 0:
-                    self.total_paused += time.time() - self.pause_start
-                    self.pause_start = 0.0
+                self.player.pause = False
                 self.state.is_paused = False
             except Exception:
                 pass
+            return self.state
+
+        if self.process:
+            try:
+                os.kill(self._pid, signal.SIGCONT)
+                if self.pause_start_ns > 0:
+                    self.total_paused_ns += time.monotonic_ns() - self.pause_start_ns
+                    self.pause_start_ns = 0
+                self.state.is_paused = False
+            except OSError:
+                pass
 
         return self.state
 
@@ -138,51 +201,121 @@ class AudioManager:
         Stop audio playback and cleanup.
 
         Behavior:
-        - Terminates mpv process gracefully (SIGTERM)
-        - Waits up to 1 second for cleanup
-        - Force kills (SIGKILL) if still running
+        - libmpv: terminates the player
+        - Subprocess: terminates mpv process gracefully (SIGTERM), waits up
+          to 1 second for cleanup, force kills (SIGKILL) if still running
+        - The wait blocks in poll() on a pidfd when available, waking as
+          soon as mpv exits instead of sleep-polling
         """
+        if self.player:
+            try:
+                self.player.terminate()
+            except Exception:
+                pass
+            finally:
+                self.player = None
+
         if self.process:
             try:
                 self.process.terminate()
-                try:
-                    self.process.wait(timeout=1.0)
-                except subprocess.TimeoutExpired:
-                    self.process.kill()
+                if self._pidfd is not None:
+                    poller = select.poll()
+                    poller.register(self._pidfd, select.POLLIN)
+                    if poller.poll(1000):
+                        self.process.wait()  # Already exited; just reap
+                    else:
+                        self.process.kill()
+                else:
+                    try:
+                        self.process.wait(timeout=1.0)
+                    except subprocess.TimeoutExpired:
+                        self.process.kill()
             except Exception:
                 pass
             finally:
+                if self._pidfd is not None:
+                    os.close(self._pidfd)
+                    self._pidfd = None
                 self.process = None
+                self._pid = None
 
         self.state.is_playing = False
 
-    def get_time(self) -> float:
+    def get_time(self, now_ns: Optional[int] = None) -> float:
         """
         Get current playback position in seconds.
 
+        Args:
+            now_ns: time.monotonic_ns() cached for this frame (reads the clock if None)
+
         Returns:
             Current time in seconds (0.0 to duration)
 
         Calculation:
-            elapsed = wall_time - start_time - total_paused
-            If paused, subtract (wall_time - pause_start)
+            libmpv: the decoder's time_pos; once it goes None at EOF,
+                the last position advanced by the monotonic clock
+            Subprocess: elapsed = now_ns - start_ns - total_paused_ns
+            If paused, subtract (now_ns - pause_start_ns)
+            Integer nanoseconds keep the pause math exact; seconds are
+            only produced at this public boundary.
         """
-        if self.state.is_paused and self.pause_start > 0:
+        if self.player:
+            try:
+                pos = self.player.time_pos
+            except Exception:
+                pos = None
+            if now_ns is None:
+                now_ns = time.monotonic_ns()
+            if pos is not None:
+                self._last_pos = pos
+                self._last_pos_ns = now_ns
+                return pos
+            if self._last_pos_ns == 0:
+                return 0.0  # Playback hasn't started yet
+            # Idle at EOF (time_pos is None): continue from the last position
+            # on the monotonic clock, frozen while paused, so time never
+            # jumps back to 0
+            if not self.state.is_paused:
+                self._last_pos += (now_ns - self._last_pos_ns) / 1e9
+            self._last_pos_ns = now_ns
+            return self._last_pos
+
+        if self.state.is_paused and self.pause_start_ns > 0:
             # Freeze time during pause
-            elapsed = self.pause_start - self.start_time - self.total_paused
+            elapsed_ns = self.pause_start_ns - self.start_ns - self.total_paused_ns
         else:
-            elapsed = time.time() - self.start_time - self.total_paused
+            if now_ns is None:
+                now_ns = time.monotonic_ns()
+            elapsed_ns = now_ns - self.start_ns - self.total_paused_ns
 
-        return max(0.0, elapsed)
+        return max(0.0, elapsed_ns / 1e9)
 
-    def get_state(self) -> AudioState:
+    def current_time(self, now_ns: Optional[int] = None) -> float:
+        """
+        Get the playback position for the per-frame hot path.
+
+        Args:
+            now_ns: time.monotonic_ns() cached for this frame (reads the clock if None)
+
+        Returns:
+            Current time in seconds, without touching the shared AudioState
+        """
+        return self.get_time(now_ns)
+
+    def get_state(self, now_ns: Optional[int] = None) -> AudioState:
         """
         Get current audio state.
 
+        Materializes the full AudioState; use current_time() when only the
+        position is needed (e.g., once per frame).
+
+        Args:
+            now_ns: time.monotonic_ns() cached for this frame (reads the clock if None)
+
         Returns:
             AudioState with all fields populated
         """
-        self.state.current_time = self.get_time()
+        self.state.current_time = self.get_time(now_ns)
         return self.state
 
     def _log_error(self, message: str) -> None:
@@ -3,6 +3,9 @@ Color palette constants for Nina's Beats.
 
 Fixed RGB values for consistent appearance across terminals.
 """
+from functools import lru_cache
+from typing import Tuple
+
 from rich.color import Color
 
 # Fixed RGB values for consistency
@@ -15,17 +18,84 @@ BLACK = Color.from_rgb(0, 0, 0)        # Black
 # Color palette for particles
 PARTICLE_COLORS = [PINK, BLUE, GOLD, WHITE]
 
-# Color gradient for visualizer (low -> high)
-def get_gradient_color(intensity: float) -> Color:
+# Opacity quantization steps for dimmed colors (imperceptible on a terminal)
+ALPHA_LEVELS = 32
+
+
+def alpha_level(alpha: float) -> int:
+    """Quantize an opacity 0.0-1.0 to its 0-ALPHA_LEVELS step."""
+    if alpha >= 1.0:
+        return ALPHA_LEVELS
+    return max(0, int(alpha * ALPHA_LEVELS))
+
+
+@lru_cache(maxsize=4096)
+def dimmed_style(r: int, g: int, b: int, level: int) -> str:
     """
-    Get a color based on intensity level.
+    Get a Rich style string for an RGB color dimmed to level / ALPHA_LEVELS.
 
     Args:
-        intensity: 0.0-1.0 intensity value
+        r, g, b: 0-255 channel values
+        level: 0-ALPHA_LEVELS opacity step (ALPHA_LEVELS = exact color)
 
     Returns:
-        Color interpolated through Blue -> Cyan -> Pink -> Gold
+        Shared style string (e.g., "rgb(127,52,90)"), formatted once per
+        distinct color and level; channels scale exactly like _dim_rgb
+    """
+    return f"rgb({r * level // ALPHA_LEVELS},{g * level // ALPHA_LEVELS},{b * level // ALPHA_LEVELS})"
+
+
+@lru_cache(maxsize=8192)
+def _dim_rgb(r: int, g: int, b: int, level: int) -> Color:
+    """Color for an RGB triplet scaled by level / ALPHA_LEVELS (cached)."""
+    return Color.from_rgb(
+        r * level // ALPHA_LEVELS,
+        g * level // ALPHA_LEVELS,
+        b * level // ALPHA_LEVELS
+    )
+
+
+def color_style(color: Color, alpha: float = 1.0) -> str:
     """
+    Get a Rich style string for a color at an opacity.
+
+    Args:
+        color: Rich Color (white is used if it has no RGB triplet)
+        alpha: Opacity 0.0-1.0, quantized with alpha_level()
+
+    Returns:
+        dimmed_style() string; full opacity gives the exact color
+    """
+    triplet = color.triplet
+    r, g, b = triplet if triplet is not None else (255, 255, 255)
+    return dimmed_style(r, g, b, alpha_level(alpha))
+
+
+def dim_color(color: Color, alpha: float) -> Color:
+    """
+    Dim a color by alpha factor (blended toward black).
+
+    Args:
+        color: Original color (must have an RGB triplet)
+        alpha: Opacity 0.0-1.0
+
+    Returns:
+        Cached Color; alpha is quantized to ALPHA_LEVELS steps so only
+        O(unique colors) objects are ever allocated. Alphas below the first
+        step return the shared BLACK, which callers may skip as invisible.
+    """
+    if alpha >= 1.0:
+        return color
+    level = alpha_level(alpha)
+    if level <= 0:
+        return BLACK
+    r, g, b = color.triplet
+    return _dim_rgb(r, g, b, level)
+
+
+# Color gradient for visualizer (low -> high)
+def _interpolate_gradient(intensity: float) -> Color:
+    """Interpolate Blue -> Cyan -> Pink -> Gold for a 0.0-1.0 intensity."""
     if intensity < 0.33:
         # Blue to Cyan
         t = intensity / 0.33
@@ -50,3 +120,49 @@ def get_gradient_color(intensity: float) -> Color:
             int(105 * (1-t) + 215 * t),
             int(180 * (1-t) + 0 * t)
         )
+
+
+# Gradient precomputed at import time; indexed by intensity * 255
+_GRADIENT_LUT = tuple(_interpolate_gradient(i / 255) for i in range(256))
+
+
+def get_gradient_color(intensity: float) -> Color:
+    """
+    Get a color based on intensity level.
+
+    Args:
+        intensity: 0.0-1.0 intensity value
+
+    Returns:
+        Color interpolated through Blue -> Cyan -> Pink -> Gold
+    """
+    return _GRADIENT_LUT[min(255, max(0, int(intensity * 255)))]
+
+
+def get_gradient_color_at(level: int) -> Color:
+    """
+    Get the gradient color for an intensity already quantized to 0-255.
+
+    Args:
+        level: 0-255 fixed-point intensity (255 = 1.0)
+
+    Returns:
+        Same color as get_gradient_color(level / 255), by direct table index
+    """
+    return _GRADIENT_LUT[level]
+
+
+# Bar phase tables, shared by the waveform scene and the spectrum visualizer
+@lru_cache(maxsize=16)
+def bar_phases(num_bars: int, step: float) -> Tuple[float, ...]:
+    """
+    Phase offset i * step for each bar index (cached, shared read-only).
+
+    Args:
+        num_bars: Number of bars
+        step: Phase advance from one bar to the next
+
+    Returns:
+        Tuple of num_bars phase offsets
+    """
+    return tuple(i * step for i in range(num_bars))
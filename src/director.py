@@ -3,6 +3,7 @@ Director for Nina's Beats.
 
 Main loop orchestrator that manages scene routing, time tracking, and transitions.
 """
+import sys
 import time
 from dataclasses import dataclass, field
 from typing import Dict, Type, Optional, List
@@ -17,10 +18,15 @@ FRAME_TIME = 1.0 / TARGET_FPS
 INITIAL_PARTICLE_BUDGET = 500
 MIN_PARTICLE_BUDGET = 50
 LAG_THRESHOLD_MULTIPLIER = 1.5
+LAG_STREAK_FRAMES = 3  # Consecutive slow frames before cutting budget
+RECOVERY_THRESHOLD_MULTIPLIER = 0.8
+BUDGET_RECOVERY_STEP = 10
+FRAME_TIME_EMA_WEIGHT = 0.1  # Weight of the newest frame in the EMA
 FADE_DURATION = 0.5
+_INV_FADE_DURATION = 1.0 / FADE_DURATION
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectorState:
     """Global state managed by Director."""
     # Time
@@ -65,6 +71,23 @@ class Director:
         self.transitioning_scene: Optional[Scene] = None
         self.state = DirectorState(lyric_map=lyric_map)
         self.scene_start_time: float = 0.0
+        self._frame_now_ns: int = 0  # time.monotonic_ns() cached once per frame
+        self._frame_now: float = 0.0  # Same instant in float seconds
+        self._last_context: Optional[SceneContext] = None  # Most recent real frame context
+        self._frame_time_ema: float = FRAME_TIME
+        self._slow_streak: int = 0
+
+    def begin_frame(self) -> float:
+        """
+        Capture the monotonic clock once for the current frame.
+
+        Returns:
+            The cached timestamp in seconds, shared by everything that needs
+            "now" this frame (_frame_now_ns holds the exact integer value)
+        """
+        self._frame_now_ns = time.monotonic_ns()
+        self._frame_now = self._frame_now_ns / 1e9
+        return self._frame_now
 
     def register_scene(self, name: str, scene_class: Type[Scene]) -> None:
         """
@@ -74,7 +97,7 @@ class Director:
             name: Scene identifier (e.g., "fireworks")
             scene_class: Scene class (not instance)
         """
-        self.scenes[name] = scene_class
+        self.scenes[sys.intern(name)] = scene_class
 
     def transition_to(self, scene_name: str) -> None:
         """
@@ -101,6 +124,9 @@ class Director:
         - If transitioning: update both current and next scenes
         - Otherwise: update only current scene
         """
+        # Remembered so scenes created mid-transition see real dimensions
+        self._last_context = context
+
         # Update current scene
         if self.current_scene:
             self.current_scene.update(dt, context)
@@ -111,7 +137,7 @@ class Director:
 
         # Handle transition progress
         if self.next_scene_name is not None:
-            self.transition_alpha += dt / FADE_DURATION
+            self.transition_alpha += dt * _INV_FADE_DURATION
             if self.transition_alpha >= 1.0:
                 self._complete_transition()
 
@@ -146,14 +172,18 @@ class Director:
         elif self.next_scene_name in self.scenes:
             # Create and instantiate new scene directly
             SceneClass = self.scenes[self.next_scene_name]
-            context = SceneContext(
-                console_width=80,  # Will be updated per frame
-                console_height=24,
-                song_time=self.state.current_time,
-                scene_time=0.0,
-                beat_intensity=0.0,
-                is_transitioning=False
-            )
+            # Reuse the latest frame context; only the very first scene
+            # (created before the loop starts) needs a placeholder
+            context = self._last_context
+            if context is None:
+                context = SceneContext(
+                    console_width=80,  # Will be updated per frame
+                    console_height=24,
+                    song_time=self.state.current_time,
+                    scene_time=0.0,
+                    beat_intensity=0.0,
+                    is_transitioning=False
+                )
             if self.current_scene:
                 self.current_scene.exit()
 
@@ -166,7 +196,7 @@ class Director:
 
         self.next_scene_name = None
         self.transition_alpha = 0.0
-        self.scene_start_time = time.time()
+        self.scene_start_time = self._frame_now
 
     def get_current_scene_name(self) -> Optional[str]:
         """Get the name of the currently active scene."""
@@ -196,12 +226,32 @@ class Director:
         if self.lyric_map:
             self.state.current_lyric = self.lyric_map.get_lyric_at(time)
 
+    def advance_lyrics(self, time: float) -> None:
+        """
+        Update the current lyric and fire scene triggers in one pass.
+
+        Args:
+            time: Current playback time
+
+        Equivalent to check_scene_triggers() followed by update_lyric(),
+        but walks the LyricMap only once per frame.
+        """
+        if self.lyric_map:
+            lyric, scene_name = self.lyric_map.advance(time)
+            self.state.current_lyric = lyric
+            if scene_name and scene_name != self.get_current_scene_name():
+                self.transition_to(scene_name)
+
     def monitor_performance(self, frame_time: float) -> None:
         """
         Monitor frame time and adjust particle budget if needed.
 
         Args:
             frame_time: Time taken for last frame in seconds
+
+        Uses an EMA of frame time with hysteresis: the budget is only cut
+        after LAG_STREAK_FRAMES consecutive laggy frames (so a single GC
+        pause doesn't collapse it), and recovers gradually when fast.
         """
         self.state.last_frame_time = frame_time
 
@@ -209,10 +259,23 @@ class Director:
         if frame_time > 0:
             self.state.fps = 1.0 / frame_time
 
-        # Check for lag and degrade particle budget
-        if frame_time > FRAME_TIME * LAG_THRESHOLD_MULTIPLIER:
-            # Reduce by 25%
-            self.state.particle_budget = max(
-                MIN_PARTICLE_BUDGET,
-                int(self.state.particle_budget * 0.75)
-            )
+        ema = self._frame_time_ema * (1 - FRAME_TIME_EMA_WEIGHT) + frame_time * FRAME_TIME_EMA_WEIGHT
+        self._frame_time_ema = ema
+
+        # Check for sustained lag and degrade particle budget
+        if ema > FRAME_TIME * LAG_THRESHOLD_MULTIPLIER:
+            self._slow_streak += 1
+            if self._slow_streak >= LAG_STREAK_FRAMES:
+                # Reduce by 25%
+                self.state.particle_budget = max(
+                    MIN_PARTICLE_BUDGET,
+                    self.state.particle_budget * 3 // 4
+                )
+                self._slow_streak = 0
+        else:
+            self._slow_streak = 0
+            if ema < FRAME_TIME * RECOVERY_THRESHOLD_MULTIPLIER:
+                self.state.particle_budget = min(
+                    INITIAL_PARTICLE_BUDGET,
+                    self.state.particle_budget + BUDGET_RECOVERY_STEP
+                )
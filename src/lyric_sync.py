@@ -4,13 +4,16 @@ Lyric synchronization module for Nina's Beats.
 Handles loading lyrics from JSON and looking up the current lyric
 based on playback time.
 """
+import bisect
 import json
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LyricEntry:
     """A single lyric with timestamp and optional scene trigger."""
 
@@ -18,10 +21,6 @@ class LyricEntry:
     text: str  # Lyric text to display (empty string for scene-only triggers)
     scene: Optional[str]  # Scene class name to trigger (e.g., "fireworks", None = no change)
 
-    def __post_init__(self):
-        if self.time < 0:
-            raise ValueError("Lyric time cannot be negative")
-
 
 class LyricMap:
     """Sorted collection of lyrics with binary search lookup."""
@@ -37,6 +36,10 @@ class LyricMap:
         """
         # Sort by time to enable efficient lookup
         self.entries = sorted(entries, key=lambda e: e.time)
+        # Parallel time keys for bisect lookups
+        self._times: List[float] = [e.time for e in self.entries]
+        # Playback cursor: number of entries at or before the last advance() time
+        self._cursor: int = 0
         self.duration = duration
         self.finale_message = finale_message
 
@@ -45,27 +48,18 @@ class LyricMap:
         """
         Load lyrics from a JSON file.
 
+        Parsed results are cached per (path, mtime), so reloading an
+        unchanged file skips the JSON parse and entry construction.
+
         Args:
             path: Path to lyrics.json file
 
         Returns:
             LyricMap with loaded entries
         """
-        with open(path, "r") as f:
-            data = json.load(f)
-
-        entries = []
-        for item in data.get("lyrics", []):
-            entries.append(LyricEntry(
-                time=item["time"],
-                text=item["text"],
-                scene=item.get("scene")
-            ))
-
-        duration = data.get("duration_seconds", 180.0)
-        finale_message = data.get("finale_message", "Forever yours,\nAhsan ♥")
-
-        return cls(entries, duration=duration, finale_message=finale_message)
+        mtime_ns = Path(path).stat().st_mtime_ns
+        entries, duration, finale_message = _load_cached(str(path), mtime_ns)
+        return cls(list(entries), duration=duration, finale_message=finale_message)
 
     def get_lyric_at(self, time: float) -> Optional[LyricEntry]:
         """
@@ -78,12 +72,8 @@ class LyricMap:
             The most recent LyricEntry, or None if time is before first lyric
         """
         # Find the most recent lyric whose time <= current time
-        for i, entry in enumerate(self.entries):
-            if entry.time > time:
-                # Previous entry is the active one
-                return self.entries[i - 1] if i > 0 else None
-        # If we didn't exceed any time, return the last entry
-        return self.entries[-1] if self.entries else None
+        i = bisect.bisect_right(self._times, time) - 1
+        return self.entries[i] if i >= 0 else None
 
     def get_scene_trigger(self, time: float) -> Optional[str]:
         """
@@ -92,26 +82,52 @@ class LyricMap:
         Unlike get_lyric_at() which returns the active lyric, this returns a scene
         ONLY when we've crossed a new scene boundary (to avoid re-triggering).
 
+        Shares the playback cursor with advance(): each trigger fires once,
+        through whichever of the two methods first crosses it.
+
         Args:
             time: Current playback time in seconds
 
         Returns:
             Scene name if we've crossed a new scene trigger, None otherwise
         """
-        # Track which scene we last triggered to avoid re-triggering
-        if not hasattr(self, '_last_triggered_scene_time'):
-            self._last_triggered_scene_time = -1.0
+        return self.advance(time)[1]
 
-        for entry in reversed(self.entries):  # Check from most recent to oldest
-            if entry.scene and entry.time <= time:
-                # We found a scene trigger that we've passed
-                # Only return it if we haven't already triggered it
-                if entry.time > self._last_triggered_scene_time:
-                    self._last_triggered_scene_time = entry.time
-                    return entry.scene
-                break  # Found the most recent, no need to check older ones
+    def advance(self, time: float) -> Tuple[Optional[LyricEntry], Optional[str]]:
+        """
+        Move the playback cursor to the given time.
 
-        return None
+        Moving forward walks the entries passed since the last call, so a
+        frame costs O(1) amortized. If time goes backward (a seek, or a
+        player position glitch), the cursor is rewound with a binary search
+        and no trigger fires; triggers fire again when crossed again.
+
+        Args:
+            time: Current playback time in seconds
+
+        Returns:
+            Tuple of (active lyric or None, newly crossed scene trigger or None);
+            if several triggers are crossed at once, the most recent one wins
+        """
+        entries = self.entries
+        i = self._cursor
+        if i > 0 and self._times[i - 1] > time:
+            # Backward: re-sync to the entries at or before time
+            i = bisect.bisect_right(self._times, time)
+            self._cursor = i
+            return (entries[i - 1] if i > 0 else None), None
+
+        fired = None
+        while i < len(entries) and entries[i].time <= time:
+            if entries[i].scene:
+                fired = entries[i].scene
+            i += 1
+        self._cursor = i
+        return (entries[i - 1] if i > 0 else None), fired
+
+    def reset(self) -> None:
+        """Rewind the playback cursor to the start, so every trigger can fire again."""
+        self._cursor = 0
 
     def get_finale_message(self) -> str:
         """
@@ -121,3 +137,43 @@ class LyricMap:
             The finale message string
         """
         return self.finale_message
+
+
+@lru_cache(maxsize=16)
+def _load_cached(path: str, mtime_ns: int) -> Tuple[Tuple[LyricEntry, ...], float, str]:
+    """
+    Parse a lyrics JSON file (cached; mtime_ns invalidates on edit).
+
+    Args:
+        path: Path to lyrics.json file
+        mtime_ns: File modification time, part of the cache key
+
+    Returns:
+        Tuple of (entries, duration, finale_message)
+
+    Raises:
+        ValueError: If any lyric time is negative
+    """
+    with open(path, "r") as f:
+        data = json.load(f)
+
+    # Validate once at the trust boundary, before building entries
+    items = data.get("lyrics", [])
+    if any(item["time"] < 0 for item in items):
+        raise ValueError("Lyric time cannot be negative")
+
+    # Scene names are interned so trigger compares and Director.scenes
+    # lookups hit CPython's identity fast path
+    entries = [
+        LyricEntry(
+            time=item["time"],
+            text=item["text"],
+            scene=sys.intern(item["scene"]) if item.get("scene") else None
+        )
+        for item in items
+    ]
+
+    duration = data.get("duration_seconds", 180.0)
+    finale_message = data.get("finale_message", "Forever yours,\nAhsan ♥")
+
+    return tuple(entries), duration, finale_message
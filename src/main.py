@@ -3,20 +3,41 @@ Nina's Beats (Symphony Edition) - Main Entry Point
 
 A terminal-based audio-visual love experience for Nina.
 """
+import atexit
+import math
+import os
+import select
 import sys
 import time
 import signal
+import statistics
+import textwrap
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+try:
+    import termios  # Unix: cbreak mode for single-key input
+    import tty
+except ImportError:
+    termios = None
+    tty = None
+
+try:
+    import msvcrt  # Windows console key polling
+except ImportError:
+    msvcrt = None
+
+from rich.align import Align
 from rich.console import Console
 from rich.live import Live
 from rich.text import Text
 
-from .director import Director, FRAME_TIME
+from .director import Director, FRAME_TIME, LAG_THRESHOLD_MULTIPLIER
 from .audio_manager import AudioManager
 from .renderer import Renderer
-from .visualizer import SpectrumVisualizer
+from .visualizer import SpectrumVisualizer, VISUALIZER_ROWS
 from .lyric_sync import LyricMap
 from .scenes.base import SceneContext
 
@@ -36,22 +57,69 @@ DEFAULT_AUDIO_PATH = DEFAULT_ASSETS_DIR / "audio.mp3"
 
 # Frame timing
 TARGET_FPS = 30
+SLEEP_SPIN_MARGIN = 0.002  # Last stretch of each frame wait is spun to avoid sleep jitter
+PACING_WINDOW = 100  # Rendered frames kept for the median frame time
+PACING_CHECK_INTERVAL = 10  # Frames between median re-evaluations
+
+# Scene name -> mood (anything unlisted is "dreamy"), and mood -> beat multiplier
+SCENE_MOODS = {
+    "fireworks": "celebration",
+    "heartbeat": "romantic",
+    "matrix_rain": "tech/cool",
+    "waveform": "energetic",
+}
+_MOOD_MULT = {"energetic": 1.2, "celebration": 1.2, "dreamy": 0.7, "romantic": 0.7}
+
+# Beat pulse, (sin(3t) + 1) / 2, sampled once per frame over a 10-minute horizon
+BEAT_TABLE_SECONDS = 600
+_BEAT_TABLE = [(math.sin(i * 3 / TARGET_FPS) + 1) / 2 for i in range(BEAT_TABLE_SECONDS * TARGET_FPS)]
+
+
+# Single-key controls (see README "Controls")
+QUIT_KEYS = frozenset("qQ")
+PAUSE_KEYS = frozenset("pP ")
 
 
 class NonBlockingInput:
-    """Non-blocking keyboard input handler."""
+    """
+    Non-blocking keyboard input handler.
+
+    On Unix the terminal is switched to cbreak mode (keys arrive without
+    Enter, Ctrl+C still raises SIGINT) and polled with select(); on Windows
+    msvcrt is polled. When stdin is not a terminal, only Ctrl+C applies.
+    """
 
     def __init__(self):
         self._quit_requested = False
         self._pause_requested = False
+        self._fd: Optional[int] = None
+        self._saved_attrs = None  # termios settings to restore on close()
 
         # Set up signal handlers for clean shutdown
         signal.signal(signal.SIGINT, self._handle_sigint)
 
+        if termios is not None and sys.stdin.isatty():
+            self._fd = sys.stdin.fileno()
+            self._saved_attrs = termios.tcgetattr(self._fd)
+            tty.setcbreak(self._fd)
+            # Restore the terminal even if we never reach close()
+            atexit.register(self.close)
+
     def _handle_sigint(self, signum, frame):
         """Handle Ctrl+C gracefully."""
         self._quit_requested = True
 
+    def _read_key(self) -> Optional[str]:
+        """Return one pending key press, or None without blocking."""
+        if self._fd is not None:
+            ready, _, _ = select.select([self._fd], [], [], 0)
+            if ready:
+                return os.read(self._fd, 1).decode("utf-8", "ignore")
+        elif msvcrt is not None and sys.stdin.isatty():
+            if msvcrt.kbhit():
+                return msvcrt.getwch()
+        return None
+
     def check(self) -> tuple[bool, bool]:
         """
         Check for input events.
@@ -59,10 +127,11 @@ class NonBlockingInput:
         Returns:
             Tuple of (should_quit, toggle_pause)
         """
-        # For terminal compatibility, we use a simple approach
-        # Real non-blocking input requires termios/unistd (Unix) or msvcrt (Windows)
-        # Since we're targeting Termux, we'll use signal-based quit
-        # and a simple flag for pause toggle
+        key = self._read_key()
+        if key in QUIT_KEYS:
+            self._quit_requested = True
+        elif key in PAUSE_KEYS:
+            self._pause_requested = True
 
         quit_requested = self._quit_requested
         pause_requested = self._pause_requested
@@ -76,6 +145,16 @@ class NonBlockingInput:
         """Request pause toggle (called by external input handler if available)."""
         self._pause_requested = True
 
+    def close(self) -> None:
+        """Restore the terminal's original mode (safe to call more than once)."""
+        if self._saved_attrs is not None:
+            try:
+                termios.tcsetattr(self._fd, termios.TCSADRAIN, self._saved_attrs)
+            except termios.error:
+                pass
+            self._saved_attrs = None
+            self._fd = None
+
 
 def load_assets(lyrics_path: Path, audio_path: Path) -> tuple[Optional[LyricMap], Optional[Path]]:
     """
@@ -130,29 +209,38 @@ def get_beat_intensity(song_time: float, scene_mood: str) -> float:
     Returns:
         Beat intensity 0.0-1.0
     """
-    import math
-
-    # Base rhythm: steady pulse
-    base = (math.sin(song_time * 3) + 1) / 2
+    # Base rhythm: steady pulse (table lookup at frame resolution)
+    base = _BEAT_TABLE[int(song_time * TARGET_FPS) % len(_BEAT_TABLE)]
 
     # Mood modulation
-    mood_multiplier = 1.0
-    if scene_mood in ("energetic", "celebration"):
-        mood_multiplier = 1.2
-    elif scene_mood in ("dreamy", "romantic"):
-        mood_multiplier = 0.7
+    mood_multiplier = _MOOD_MULT.get(scene_mood, 1.0)
 
     # Add some variance
     intensity = min(1.0, base * mood_multiplier)
     return intensity
 
 
+@lru_cache(maxsize=256)
+def _wrap_lyric(text: str, width: int) -> tuple[str, ...]:
+    """
+    Word-wrap a lyric line (cached; a lyric stays on screen for many frames).
+
+    Args:
+        text: Lyric text to wrap
+        width: Maximum line width
+
+    Returns:
+        Tuple of wrapped lines
+    """
+    return tuple(textwrap.wrap(text, width=width, break_long_words=False))
+
+
 def build_frame(
     renderer: Renderer,
     director,
     visualizer: SpectrumVisualizer,
     lyric_text: Optional[str],
-    beat_intensity: float,
+    context: SceneContext,
     width: int,
     height: int
 ) -> Text:
@@ -164,7 +252,7 @@ def build_frame(
         director: Director with active scenes
         visualizer: SpectrumVisualizer for beat display
         lyric_text: Current lyric to display
-        beat_intensity: Current beat intensity
+        context: This frame's SceneContext, shared with the scene update
         width: Terminal width
         height: Terminal height
 
@@ -179,22 +267,10 @@ def build_frame(
     if director.current_scene:
         scene = director.current_scene
         # Call the scene's render method with the buffer
-        # Get scene alpha from director state
+        # The current scene always renders at full opacity
         scene_alpha = 1.0
-        if hasattr(director, 'current_state') and director.current_state:
-            scene_alpha = director.current_state.alpha
-
-        # Create a context for the scene with current dimensions
-        context = SceneContext(
-            console_width=width,
-            console_height=height,
-            song_time=director.song_time if hasattr(director, 'song_time') else 0,
-            scene_time=director.current_state.started_at if hasattr(director, 'current_state') and director.current_state else 0,
-            beat_intensity=beat_intensity,
-            is_transitioning=False
-        )
 
-        # Update scene's context and render
+        # Update scene's context (also while paused, when update is skipped) and render
         scene.context = context
         scene.render(buffer, scene_alpha)
 
@@ -211,8 +287,7 @@ def build_frame(
                 text_width = width - 4
 
             # Word-wrap the lyric text
-            import textwrap
-            wrapped_lines = textwrap.wrap(lyric_text, width=text_width, break_long_words=False)
+            wrapped_lines = _wrap_lyric(lyric_text, text_width)
 
             # Render each line, centered within padded area
             lyric_start_y = (height - len(wrapped_lines)) // 2
@@ -226,14 +301,28 @@ def build_frame(
                     buffer.set_text(start_x, y, line, "pink1 bold")
 
     # Render visualizer at bottom (subtle)
-    viz_lines = visualizer.render(width).split('\n')
-    viz_y = height - len(viz_lines)
-    for i, line in enumerate(viz_lines):
-        buffer.set_text(0, viz_y + i, line, "cyan dim")
+    visualizer.render_into(buffer, 0, height - VISUALIZER_ROWS, "cyan dim")
 
     return buffer.to_rich_text()
 
 
+def precise_sleep(duration: float) -> None:
+    """
+    Sleep for duration seconds with sub-millisecond accuracy.
+
+    Args:
+        duration: Time to wait in seconds
+
+    time.sleep() can overshoot by 1-15 ms, so it only covers all but the
+    last SLEEP_SPIN_MARGIN, which is busy-waited on perf_counter().
+    """
+    deadline = time.perf_counter() + duration
+    if duration > SLEEP_SPIN_MARGIN:
+        time.sleep(duration - SLEEP_SPIN_MARGIN)
+    while time.perf_counter() < deadline:
+        pass
+
+
 def run_main_loop(
     director: Director,
     audio_manager: Optional[AudioManager],
@@ -280,18 +369,29 @@ def run_main_loop(
         if not initial_scene:
             initial_scene = "intro"  # Default
         director.transition_to(initial_scene)
+        director.begin_frame()
         director._complete_transition()
 
     # Start Rich Live display
     live = renderer.start_live()
 
     # Start time for experience
-    start_time = time.time()
+    start_time = time.monotonic_ns() / 1e9
     frame_count = 0
 
+    # Last built frame, reused while paused if nothing visible changed
+    last_frame: Optional[Text] = None
+    last_frame_key = None
+
+    # Adaptive pacing: if the median render is too slow for the target
+    # rate, only every other tick is rendered so the terminal can keep up
+    render_durations: deque = deque(maxlen=PACING_WINDOW)
+    half_rate = False
+
     try:
         while True:
-            frame_start = time.time()
+            # Read the clock once; everything below reuses this timestamp
+            frame_start = director.begin_frame()
 
             # Check for quit
             should_quit, toggle_pause = input_handler.check()
@@ -309,9 +409,9 @@ def run_main_loop(
 
             # Get current time
             if audio_manager:
-                current_time = audio_manager.get_time()
+                current_time = audio_manager.current_time(director._frame_now_ns)
             else:
-                current_time = time.time() - start_time
+                current_time = frame_start - start_time
 
             # Check if experience is complete
             # If finale scene is active, give it extra time to display
@@ -333,20 +433,12 @@ def run_main_loop(
 
             # Calculate beat intensity
             scene_name = director.get_current_scene_name() or "intro"
-            scene_mood = "dreamy"
-            if scene_name == "fireworks":
-                scene_mood = "celebration"
-            elif scene_name == "heartbeat":
-                scene_mood = "romantic"
-            elif scene_name == "matrix_rain":
-                scene_mood = "tech/cool"
-            elif scene_name == "waveform":
-                scene_mood = "energetic"
+            scene_mood = SCENE_MOODS.get(scene_name, "dreamy")
 
             beat_intensity = get_beat_intensity(current_time, scene_mood)
 
             # Create scene context
-            scene_time = current_time - director.scene_start_time
+            scene_time = frame_start - director.scene_start_time
             context = SceneContext(
                 console_width=width,
                 console_height=height,
@@ -358,8 +450,7 @@ def run_main_loop(
 
             # Update director
             director.state.current_time = current_time
-            director.check_scene_triggers(current_time)
-            director.update_lyric(current_time)
+            director.advance_lyrics(current_time)
 
             # Update visualizer
             if not is_paused:
@@ -374,25 +465,38 @@ def run_main_loop(
             if director.state.current_lyric:
                 lyric_text = director.state.current_lyric.text
 
-            # Build and render frame
-            frame_content = build_frame(
-                renderer=renderer,
-                director=director,
-                visualizer=visualizer,
-                lyric_text=lyric_text,
-                beat_intensity=beat_intensity,
-                width=width,
-                height=height
-            )
-
-            # Update Live display
-            renderer.update_display(frame_content)
+            render_this_tick = not half_rate or frame_count % 2 == 0
+            if render_this_tick:
+                # Build and render frame (scenes and visualizer are frozen while
+                # paused, so the previous frame is still valid if nothing else moved)
+                frame_key = (width, height, lyric_text, scene_name)
+                if is_paused and last_frame is not None and frame_key == last_frame_key:
+                    frame_content = last_frame
+                else:
+                    frame_content = build_frame(
+                        renderer=renderer,
+                        director=director,
+                        visualizer=visualizer,
+                        lyric_text=lyric_text,
+                        context=context,
+                        width=width,
+                        height=height
+                    )
+                    last_frame = frame_content
+                    last_frame_key = frame_key
+
+                # Update Live display
+                renderer.update_display(frame_content)
 
             # Frame timing
-            frame_time = time.time() - frame_start
+            frame_time = time.monotonic_ns() / 1e9 - frame_start
+            if render_this_tick:
+                render_durations.append(frame_time)
+            if frame_count % PACING_CHECK_INTERVAL == 0 and render_durations:
+                half_rate = statistics.median(render_durations) > FRAME_TIME * LAG_THRESHOLD_MULTIPLIER
             sleep_time = FRAME_TIME - frame_time
             if sleep_time > 0:
-                time.sleep(sleep_time)
+                precise_sleep(sleep_time)
 
             frame_count += 1
 
@@ -405,6 +509,9 @@ def run_main_loop(
         traceback.print_exc()
         return False
     finally:
+        # Back to line-buffered input (the finale waits for Enter)
+        input_handler.close()
+
         # Stop Live display
         renderer.stop_live()
 
@@ -428,10 +535,6 @@ def run_finale_sequence(renderer: Renderer, console: Console, lyric_map: Optiona
         console: Rich Console
         lyric_map: LyricMap containing finale_message
     """
-    from rich.align import Align
-    from rich.text import Text
-    from rich.panel import Panel
-
     # Get finale message
     finale_message = "Forever yours,\nAhsan ♥"
     if lyric_map and hasattr(lyric_map, 'finale_message'):
@@ -6,9 +6,14 @@ Handles particle physics simulation with gravity, drag, and life/decay.
 import random
 import math
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from rich.color import Color
 
+from .colors import ALPHA_LEVELS, BLACK, dim_color, dimmed_style
+
+
+_BLACK = BLACK  # Returned for invisible particles; compare with `is` to skip them
+
 
 @dataclass
 class Particle:
@@ -92,15 +97,200 @@ class Particle:
         At death: dim toward black
         """
         brightness = self.get_brightness()
-        if brightness <= 0:
-            return Color.from_rgb(0, 0, 0)
-
-        r, g, b = self.color.triplet
-        return Color.from_rgb(
-            int(r * brightness),
-            int(g * brightness),
-            int(b * brightness)
-        )
+        if brightness * ALPHA_LEVELS < 1:
+            return _BLACK  # Below the first dim step: fully black
+
+        # Cached per (color, quantized brightness) instead of a new Color per call
+        return dim_color(self.color, brightness)
+
+
+def _step_particles(
+    x: List[float],
+    y: List[float],
+    vx: List[float],
+    vy: List[float],
+    gravity: List[float],
+    drag: List[float],
+    life: List[float],
+    max_life: List[float],
+    char: List[str],
+    rgb: List[Tuple[int, int, int]],
+    dt: float
+) -> int:
+    """
+    Physics kernel: advance parallel particle arrays in place by dt and
+    compact out the particles that died, in the same pass.
+
+    Same math as Particle.update(). Fields are read through one zip()
+    (no per-field indexing); survivors are written back at a write cursor,
+    and the unchanged fields are only copied once a death has shifted them.
+    Particles share a handful of drag values (one per burst style), so the
+    clamped drag factor is computed once per distinct drag per step.
+
+    Returns:
+        Number of surviving particles; the arrays past it are stale
+    """
+    drag_factors: Dict[float, float] = {}
+    i = 0
+    w = 0
+    for px, py, pvx, pvy, pg, pd, pl, pm in zip(x, y, vx, vy, gravity, drag, life, max_life):
+        pl -= dt / pm
+        if pl > 0:
+            # Gravity, then drag (air resistance)
+            drag_factor = drag_factors.get(pd)
+            if drag_factor is None:
+                drag_factor = drag_factors[pd] = max(0, 1 - pd * dt)
+            pvy = (pvy + pg * dt) * drag_factor
+            pvx *= drag_factor
+            vx[w] = pvx
+            vy[w] = pvy
+
+            # Position and life
+            x[w] = px + pvx * dt
+            y[w] = py + pvy * dt
+            life[w] = pl
+            if w != i:
+                gravity[w] = pg
+                drag[w] = pd
+                max_life[w] = pm
+                char[w] = char[i]
+                rgb[w] = rgb[i]
+            w += 1
+        i += 1
+    return w
+
+
+class ParticleSystem:
+    """
+    Particles stored as parallel arrays (structure-of-arrays).
+
+    Holds the same fields as Particle, one list per field, so a frame's
+    physics step is a single loop over flat lists instead of a method
+    call per Particle object.
+    """
+
+    def __init__(self):
+        """Initialize an empty particle system."""
+        self.x: List[float] = []
+        self.y: List[float] = []
+        self.vx: List[float] = []
+        self.vy: List[float] = []
+        self.gravity: List[float] = []
+        self.drag: List[float] = []
+        self.life: List[float] = []
+        self.max_life: List[float] = []
+        self.char: List[str] = []
+        # Base color as a plain RGB triplet; no Color objects on the render path
+        self.rgb: List[Tuple[int, int, int]] = []
+
+    def _arrays(self) -> tuple:
+        """All parallel arrays, in field order."""
+        return (self.x, self.y, self.vx, self.vy, self.gravity, self.drag,
+                self.life, self.max_life, self.char, self.rgb)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __delitem__(self, index: slice) -> None:
+        """Delete a slice of particles in place (e.g., del system[keep:])."""
+        for array in self._arrays():
+            del array[index]
+
+    def add(self, particle: Particle) -> None:
+        """Append one particle's fields to the arrays."""
+        self.x.append(particle.x)
+        self.y.append(particle.y)
+        self.vx.append(particle.vx)
+        self.vy.append(particle.vy)
+        self.gravity.append(particle.gravity)
+        self.drag.append(particle.drag)
+        self.life.append(particle.life)
+        self.max_life.append(particle.max_life)
+        self.char.append(particle.char)
+        self.rgb.append(tuple(particle.color.triplet))
+
+    def spawn_many(
+        self,
+        xs: List[float],
+        ys: List[float],
+        vxs: List[float],
+        vys: List[float],
+        gravity: float,
+        drag: float,
+        max_lives: List[float],
+        chars: List[str],
+        rgbs: List[Tuple[int, int, int]]
+    ) -> range:
+        """
+        Append a batch of particles at full life, one extend() per array.
+
+        Args:
+            xs, ys: Positions
+            vxs, vys: Velocities
+            gravity, drag: Physics constants shared by the batch
+            max_lives: Lifetimes in seconds
+            chars: Characters
+            rgbs: Base colors as RGB triplets
+
+        Returns:
+            Index range of the new particles
+        """
+        count = len(xs)
+        start = len(self.x)
+        self.x.extend(xs)
+        self.y.extend(ys)
+        self.vx.extend(vxs)
+        self.vy.extend(vys)
+        self.gravity.extend([gravity] * count)
+        self.drag.extend([drag] * count)
+        self.life.extend([1.0] * count)  # Start at full life
+        self.max_life.extend(max_lives)
+        self.char.extend(chars)
+        self.rgb.extend(rgbs)
+        return range(start, start + count)
+
+    def extend(self, particles: List[Particle]) -> None:
+        """Append several particles."""
+        for p in particles:
+            self.add(p)
+
+    def clear(self) -> None:
+        """Remove all particles."""
+        for array in self._arrays():
+            array.clear()
+
+    def update(self, dt: float) -> None:
+        """
+        Step every particle by dt, then drop dead ones.
+
+        Args:
+            dt: Delta time in seconds
+
+        Same physics as Particle.update(), applied across the arrays in a
+        single fused step-and-compact pass.
+        """
+        alive = _step_particles(self.x, self.y, self.vx, self.vy, self.gravity,
+                                self.drag, self.life, self.max_life, self.char,
+                                self.rgb, dt)
+        if alive < len(self.x):
+            del self[alive:]
+
+    def iter_render(self, alpha: float = 1.0) -> Iterator[Tuple[int, int, str, str]]:
+        """
+        Yield (x, y, char, style) for each particle, dimmed by life and alpha.
+
+        Args:
+            alpha: Scene opacity 0.0-1.0, folded into the brightness
+
+        Uses the same brightness curve as Particle.get_render_color(), but
+        goes straight to a cached style string instead of building a Color.
+        Particles too dim to show (they would quantize to black) are skipped.
+        """
+        for px, py, char, (r, g, b), l in zip(self.x, self.y, self.char, self.rgb, self.life):
+            level = int(4 * l * (1 - l) * alpha * ALPHA_LEVELS)
+            if level <= 0:
+                continue  # Below the first dim step: invisible
+            yield int(px), int(py), char, dimmed_style(r, g, b, level)
 
 
 class ParticleFactory:
@@ -193,3 +383,109 @@ class ParticleFactory:
             vy = math.sin(angle) * speed_var
             particles.append(self.create(x, y, vx, vy, life))
         return particles
+
+    def emit_burst(
+        self,
+        system: ParticleSystem,
+        x: float,
+        y: float,
+        count: int,
+        speed: float = 10.0,
+        life: float = 2.0,
+        gravity: float = 9.8,
+        drag: float = 0.5,
+        spread: float = 0.2
+    ) -> range:
+        """
+        Spawn a burst straight into a ParticleSystem's arrays.
+
+        Same distribution as create_burst(), but no Particle objects are
+        built: each field is generated into a list and appended with one
+        extend() per array.
+
+        Args:
+            system: ParticleSystem to append to
+            x, y: Center of burst
+            count: Number of particles to create
+            speed: Base velocity magnitude
+            life: Particle lifetime in seconds
+            gravity: Downward acceleration
+            drag: Air resistance
+            spread: Velocity variation (Gaussian std dev)
+
+        Returns:
+            Index range of the new particles within the system
+        """
+        uniform = random.uniform
+        gauss = random.gauss
+        choice = random.choice
+        cos = math.cos
+        sin = math.sin
+        chars = self.chars
+        rgbs = [tuple(c.triplet) for c in self.colors]
+        two_pi = 2 * math.pi
+
+        vxs: List[float] = []
+        vys: List[float] = []
+        new_chars: List[str] = []
+        new_rgb: List[Tuple[int, int, int]] = []
+        # Draw in the same order as create_burst() so seeded runs match
+        for _ in range(count):
+            angle = uniform(0, two_pi)
+            speed_var = uniform(speed * 0.5, speed * 1.5)
+            vxs.append(gauss(cos(angle) * speed_var, spread))
+            vys.append(gauss(sin(angle) * speed_var, spread))
+            new_chars.append(choice(chars))
+            new_rgb.append(choice(rgbs))
+
+        return system.spawn_many(
+            [x] * count, [y] * count, vxs, vys, gravity, drag,
+            [life] * count, new_chars, new_rgb
+        )
+
+    def emit_floating_burst(
+        self,
+        system: ParticleSystem,
+        cx: float,
+        cy: float,
+        count: int,
+        spread_x: float,
+        spread_y: float,
+        vx_range: Tuple[float, float],
+        vy_range: Tuple[float, float],
+        life_range: Tuple[float, float],
+        gravity: float,
+        drag: float
+    ) -> range:
+        """
+        Spawn a burst scattered around a point, drifting with gravity.
+
+        Each field is drawn for the whole burst at once, then appended to
+        the system with one extend() per array.
+
+        Args:
+            system: ParticleSystem to append to
+            cx, cy: Center of the scatter area
+            count: Number of particles to create
+            spread_x, spread_y: Half-size of the scatter area
+            vx_range, vy_range: Uniform (low, high) velocity ranges
+            life_range: Uniform (low, high) lifetime in seconds
+            gravity: Downward acceleration (negative floats upward)
+            drag: Air resistance
+
+        Returns:
+            Index range of the new particles within the system
+        """
+        uniform = random.uniform
+        choice = random.choice
+        chars = self.chars
+        rgbs = [tuple(c.triplet) for c in self.colors]
+        n = range(count)
+        xs = [cx + uniform(-spread_x, spread_x) for _ in n]
+        ys = [cy + uniform(-spread_y, spread_y) for _ in n]
+        vys = [uniform(*vy_range) for _ in n]
+        vxs = [uniform(*vx_range) for _ in n]
+        life_times = [uniform(*life_range) for _ in n]
+        new_chars = [choice(chars) for _ in n]
+        new_rgb = [choice(rgbs) for _ in n]
+        return system.spawn_many(xs, ys, vxs, vys, gravity, drag, life_times, new_chars, new_rgb)
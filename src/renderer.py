@@ -7,25 +7,58 @@ import shutil
 from rich.console import Console
 from rich.live import Live
 from rich.color import Color
-from rich.text import Text
-from typing import Optional, Tuple, List
+from rich.errors import StyleSyntaxError
+from rich.style import Style
+from rich.text import Span, Text
+from typing import Dict, Iterable, Optional, Tuple, List, Union
+
+from .colors import color_style, dim_color
 
 
 class FrameBuffer:
-    """A 2D character buffer for building terminal frames."""
+    """
+    A 2D character buffer for building terminal frames.
+
+    Stored as structure-of-arrays: one row list of characters and one row
+    list of integer style IDs, so clears and text writes are C-level slice
+    copies instead of per-cell tuple construction.
+    """
 
     def __init__(self, width: int, height: int):
         """Initialize an empty frame buffer."""
         self.width = width
         self.height = height
-        # Buffer of (char, style) tuples
-        self.buffer: List[List[tuple[str, str]]] = [
-            [(" ", "") for _ in range(width)] for _ in range(height)
-        ]
+        # Interned style strings; ID 0 is the unstyled default
+        self._style_table: List[str] = [""]
+        self._style_ids: Dict[str, int] = {"": 0}
+        # Parsed Style per ID, so Rich never re-parses style strings per span
+        self._span_styles: List[Union[Style, str]] = [Style.null()]
+        # Template rows copied in on clear()
+        self._blank_chars: List[str] = [" "] * width
+        self._blank_styles: List[int] = [0] * width
+        self.chars: List[List[str]] = [self._blank_chars[:] for _ in range(height)]
+        self.styles: List[List[int]] = [self._blank_styles[:] for _ in range(height)]
+
+    def _intern(self, style: str) -> int:
+        """Return the integer ID for a style string, registering it if new."""
+        style_id = self._style_ids.get(style)
+        if style_id is None:
+            style_id = len(self._style_table)
+            self._style_table.append(style)
+            self._style_ids[style] = style_id
+            try:
+                self._span_styles.append(Style.parse(style))
+            except StyleSyntaxError:
+                # Leave it to Rich, which ignores unknown styles when rendering
+                self._span_styles.append(style)
+        return style_id
 
     def clear(self):
         """Clear the buffer to empty spaces."""
-        self.buffer = [[(" ", "") for _ in range(self.width)] for _ in range(self.height)]
+        for row in self.chars:
+            row[:] = self._blank_chars
+        for row in self.styles:
+            row[:] = self._blank_styles
 
     def set(self, x: int, y: int, char: str, style: str = ""):
         """
@@ -38,7 +71,30 @@ class FrameBuffer:
             style: Rich style string
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.buffer[y][x] = (char, style)
+            self.chars[y][x] = char
+            self.styles[y][x] = self._intern(style)
+
+    def set_many(self, cells: Iterable[Tuple[int, int, str, str]]) -> None:
+        """
+        Set many characters in one call.
+
+        Args:
+            cells: Iterable of (x, y, char, style); out-of-bounds cells are skipped
+
+        Same result as calling set() per cell, with the bounds, row lookups
+        and style interning bound locally once for the whole batch.
+        """
+        width = self.width
+        height = self.height
+        chars = self.chars
+        styles = self.styles
+        style_ids = self._style_ids
+        intern = self._intern
+        for x, y, char, style in cells:
+            if 0 <= x < width and 0 <= y < height:
+                chars[y][x] = char
+                style_id = style_ids.get(style)
+                styles[y][x] = style_id if style_id is not None else intern(style)
 
     def set_text(self, x: int, y: int, text: str, style: str = ""):
         """
@@ -50,9 +106,44 @@ class FrameBuffer:
             text: Text to place
             style: Rich style string
         """
-        for i, char in enumerate(text):
-            if 0 <= x + i < self.width and 0 <= y < self.height:
-                self.buffer[y][x + i] = (char, style)
+        if not 0 <= y < self.height:
+            return
+        # Clip the span to the buffer, then store it with one slice write
+        start = max(0, x)
+        end = min(self.width, x + len(text))
+        if start >= end:
+            return
+        if start != x or end - start != len(text):
+            text = text[start - x:end - x]  # Only copy the string when clipped
+        self.chars[y][start:end] = text
+        self.styles[y][start:end] = [self._intern(style)] * (end - start)
+
+    def fill_rect(self, x: int, y: int, width: int, height: int, char: str, style: str = ""):
+        """
+        Fill a rectangle with one character and style.
+
+        Args:
+            x: Left column (0-indexed)
+            y: Top row (0-indexed)
+            width: Columns to fill
+            height: Rows to fill
+            char: Character to place in every cell
+            style: Rich style string
+
+        The rectangle is clipped to the buffer, the style is interned once,
+        and each row is written with one slice copy.
+        """
+        start = max(0, x)
+        end = min(self.width, x + width)
+        top = max(0, y)
+        bottom = min(self.height, y + height)
+        if start >= end or top >= bottom:
+            return
+        run_chars = [char] * (end - start)
+        run_styles = [self._intern(style)] * (end - start)
+        for row in range(top, bottom):
+            self.chars[row][start:end] = run_chars
+            self.styles[row][start:end] = run_styles
 
     def to_rich_text(self) -> Text:
         """
@@ -60,29 +151,32 @@ class FrameBuffer:
 
         Returns:
             Text object with styled content
+
+        Builds one plain string plus a flat list of style spans and
+        constructs a single Text, instead of appending per row and run.
+        Spans carry the Style parsed once per interned ID.
         """
-        result = Text()
+        style_table = self._span_styles
+        width = self.width
+        pieces: List[str] = []
+        spans: List[Span] = []
+        offset = 0
         for y in range(self.height):
-            line_text = Text()
+            chars = self.chars[y]
+            styles = self.styles[y]
+            pieces.append("".join(chars))
             x = 0
-            while x < self.width:
-                char, style = self.buffer[y][x]
-                # Collect consecutive chars with same style
+            while x < width:
+                # Collect consecutive chars with same style (integer compare)
                 run_start = x
-                current_style = style
-                while x + 1 < self.width and self.buffer[y][x + 1][1] == current_style:
-                    x += 1
-                    char += self.buffer[y][x][0]
+                current_style = styles[x]
                 x += 1
-                # Add styled segment
+                while x < width and styles[x] == current_style:
+                    x += 1
                 if current_style:
-                    line_text.append(char, style=current_style)
-                else:
-                    line_text.append(char)
-            result.append(line_text)
-            if y < self.height - 1:
-                result.append("\n")
-        return result
+                    spans.append(Span(offset + run_start, offset + x, style_table[current_style]))
+            offset += width + 1  # Row plus its newline
+        return Text("\n".join(pieces), spans=spans)
 
 
 class Renderer:
@@ -153,15 +247,7 @@ class Renderer:
         Returns:
             Color dimmed by alpha (blended toward black)
         """
-        if alpha >= 1.0:
-            return color
-        # Blend toward black
-        r, g, b = color.triplet
-        return Color.from_rgb(
-            int(r * alpha),
-            int(g * alpha),
-            int(b * alpha)
-        )
+        return dim_color(color, alpha)
 
     def _color_to_style(self, color: Color) -> str:
         """
@@ -171,10 +257,10 @@ class Renderer:
             color: Rich Color object
 
         Returns:
-            Style string that Rich accepts (e.g., "rgb(255,105,180)")
+            Style string that Rich accepts (e.g., "rgb(255,105,180)"),
+            cached per exact RGB triplet
         """
-        r, g, b = color.triplet
-        return f"rgb({int(r)},{int(g)},{int(b)})"
+        return color_style(color)
 
     def start_live(self) -> Live:
         """
@@ -9,15 +9,16 @@ from typing import List, Optional, TYPE_CHECKING
 from rich.console import Console
 from rich.color import Color
 
+from ..colors import WHITE, color_style, dim_color
 from ..particle import Particle
 
 if TYPE_CHECKING:
     from ..renderer import FrameBuffer
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SceneContext:
-    """Context provided to scenes by Director."""
+    """Context provided to scenes by Director (immutable; built once per frame)."""
     console_width: int
     console_height: int
     song_time: float  # Current audio position in seconds
@@ -101,7 +102,8 @@ class Scene(ABC):
             ratio: Keep this fraction of particles (0.0-1.0)
         """
         keep_count = int(len(self.particles) * ratio)
-        self.particles = self.particles[:keep_count]
+        # In place; works for both lists and ParticleSystem
+        del self.particles[keep_count:]
 
     def _apply_alpha(self, color: Color, alpha: float) -> Color:
         """
@@ -112,21 +114,14 @@ class Scene(ABC):
             alpha: Opacity 0.0-1.0
 
         Returns:
-            Color dimmed by alpha
+            Color dimmed by alpha (cached; alpha quantized to ALPHA_LEVELS)
         """
         if alpha >= 1.0:
             return color
+        if color.triplet is None:
+            color = WHITE  # Fallback to white if triplet is None
         # Blend toward black
-        if color.triplet is not None:
-            r, g, b = color.triplet
-        else:
-            # Fallback to white if triplet is None
-            r, g, b = 255, 255, 255
-        return Color.from_rgb(
-            int(r * alpha),
-            int(g * alpha),
-            int(b * alpha)
-        )
+        return dim_color(color, alpha)
 
     def _color_to_style(self, color: Color) -> str:
         """
@@ -138,11 +133,21 @@ class Scene(ABC):
         Returns:
             Style string that Rich accepts (e.g., "rgb(255,105,180)")
         """
-        if color.triplet is not None:
-            r, g, b = color.triplet
-        else:
-            r, g, b = 255, 255, 255  # fallback to white if triplet is None
-        return f"rgb({int(r)},{int(g)},{int(b)})"
+        return color_style(color)
+
+    def _dimmed_style(self, color: Color, alpha: float) -> str:
+        """
+        Style string for a color dimmed by alpha, in one cached step.
+
+        Args:
+            color: Rich Color object
+            alpha: Opacity 0.0-1.0
+
+        Returns:
+            Style string; same result as _color_to_style(_apply_alpha(...))
+            without building the intermediate Color
+        """
+        return color_style(color, alpha)
 
     def _set_buffer(self, buffer: 'FrameBuffer', x: int, y: int, char: str, color: Color, alpha: float = 1.0) -> None:
         """
@@ -157,9 +162,7 @@ class Scene(ABC):
             alpha: Additional opacity 0.0-1.0
         """
         if 0 <= x < self.context.console_width and 0 <= y < self.context.console_height:
-            final_color = self._apply_alpha(color, alpha)
-            style = self._color_to_style(final_color)
-            buffer.set(x, y, char, style)
+            buffer.set(x, y, char, color_style(color, alpha))
 
     def _set_text_buffer(self, buffer: 'FrameBuffer', x: int, y: int, text: str, color: Color, alpha: float = 1.0) -> None:
         """
@@ -174,9 +177,7 @@ class Scene(ABC):
             alpha: Additional opacity 0.0-1.0
         """
         if 0 <= y < self.context.console_height:
-            final_color = self._apply_alpha(color, alpha)
-            style = self._color_to_style(final_color)
-            buffer.set_text(x, y, text, style)
+            buffer.set_text(x, y, text, color_style(color, alpha))
 
     def _center_text(self, text: str, width: int) -> str:
         """
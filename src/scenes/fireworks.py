@@ -7,7 +7,7 @@ import random
 from rich.color import Color
 
 from .base import Scene, SceneContext
-from ..particle import Particle, ParticleFactory
+from ..particle import Particle, ParticleFactory, ParticleSystem
 from ..colors import PINK, BLUE, GOLD
 
 
@@ -25,6 +25,7 @@ class SceneFireworks(Scene):
         self.flash_timer = 0.0
         self.flash_duration = 0.1  # Flash duration
         self.is_flashing = False
+        self.particles = ParticleSystem()
 
         # Particle factory for firework particles
         self.factory = ParticleFactory(
@@ -34,12 +35,12 @@ class SceneFireworks(Scene):
 
     def enter(self) -> None:
         """Called when scene becomes active."""
-        self.particles = []
+        self.particles.clear()
         self.burst_timer = 0.0
 
     def exit(self) -> None:
         """Called when scene becomes inactive."""
-        self.particles = []
+        self.particles.clear()
 
     def update(self, dt: float, context: SceneContext) -> None:
         """
@@ -68,12 +69,8 @@ class SceneFireworks(Scene):
             if self.flash_timer <= 0:
                 self.is_flashing = False
 
-        # Update existing particles
-        for p in self.particles:
-            p.update(dt)
-
-        # Remove dead particles
-        self.particles = [p for p in self.particles if p.is_alive()]
+        # Update existing particles and remove dead ones
+        self.particles.update(dt)
 
     def _spawn_burst(self, context: SceneContext) -> None:
         """Spawn a new particle burst."""
@@ -91,8 +88,7 @@ class SceneFireworks(Scene):
         count = int(20 + context.beat_intensity * 30)
         speed = 5.0 + context.beat_intensity * 10.0
 
-        new_particles = self.factory.create_burst(x, y, count, speed)
-        self.particles.extend(new_particles)
+        self.factory.emit_burst(self.particles, x, y, count, speed)
 
     def render(self, buffer, alpha: float = 1.0) -> None:
         """
@@ -102,9 +98,5 @@ class SceneFireworks(Scene):
             buffer: FrameBuffer to render into
             alpha: Opacity 0.0-1.0 for fade
         """
-        # Render particles
-        for p in self.particles:
-            px, py = int(p.x), int(p.y)
-            if 0 <= px < self.context.console_width and 0 <= py < self.context.console_height:
-                color = p.get_render_color()
-                self._set_buffer(buffer, px, py, p.char, color, alpha)
+        # Render particles (styles already include life and alpha dimming)
+        buffer.set_many(self.particles.iter_render(alpha))
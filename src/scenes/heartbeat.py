@@ -4,9 +4,21 @@ Refined: Smaller, galaxy-style aesthetic with stardust fill.
 """
 import math
 import random
+from functools import lru_cache
+from typing import List, Tuple
 from rich.color import Color
 from .base import Scene, SceneContext
-from ..colors import PINK, WHITE
+from ..colors import PINK
+
+# Precomputed heart shape: normalized coordinates span ±HEART_EXTENT
+HEART_EXTENT = 1.5
+HEART_TEMPLATE_SIZE = 256
+OUTSIDE, OUTLINE, INSIDE = 0, 1, 2
+
+# sin^6 heartbeat curve over one 2π period (THUMP_LUT_SIZE must be a power of two)
+THUMP_LUT_SIZE = 1024
+_THUMP_LUT = [math.sin(2 * math.pi * i / THUMP_LUT_SIZE) ** 6 for i in range(THUMP_LUT_SIZE)]
+_THUMP_INDEX_SCALE = THUMP_LUT_SIZE / (2 * math.pi)
 
 class SceneHeartbeat(Scene):
     """Heartbeat scene with a smaller, stardust-style heart."""
@@ -19,20 +31,28 @@ class SceneHeartbeat(Scene):
         self.current_scale = 1.0
         self.beat_phase = 0.0
         # Pre-calculate some random static noise for the "stars" inside the heart
-        # so they don't jitter around constantly
-        self.noise_map = {} 
+        # so they don't jitter around constantly: one row list per console row
+        self.noise: List[List[float]] = []
 
     def enter(self) -> None:
         self.current_scale = 1.0
         self.beat_phase = 0.0
+        self._ensure_noise()
+
+    def _ensure_noise(self) -> None:
+        """(Re)build the noise texture when the console size changes."""
+        width = self.context.console_width
+        height = self.context.console_height
+        if len(self.noise) != height or (self.noise and len(self.noise[0]) != width):
+            self.noise = [[random.random() for _ in range(width)] for _ in range(height)]
 
     def update(self, dt: float, context: SceneContext) -> None:
         # Slower, deeper throb
         self.beat_phase += dt * 3.5
 
         # Organic heartbeat curve (sharp rise, slow fall)
-        # sin^6 gives a nice sharp "thump"
-        thump = math.sin(self.beat_phase) ** 6
+        # sin^6 gives a nice sharp "thump" (table lookup)
+        thump = _THUMP_LUT[int(self.beat_phase * _THUMP_INDEX_SCALE) & (THUMP_LUT_SIZE - 1)]
         
         # Reduced scaling range so it doesn't jump too much
         # Base scale 1.0, max scale 1.15
@@ -41,55 +61,111 @@ class SceneHeartbeat(Scene):
         # Smooth movement
         self.current_scale += (target - self.current_scale) * (dt * 5)
 
-    def _get_noise(self, x, y):
-        """Stable random noise for stardust effect"""
-        if (x, y) not in self.noise_map:
-            self.noise_map[(x, y)] = random.random()
-        return self.noise_map[(x, y)]
-
     def render(self, buffer, alpha: float = 1.0) -> None:
-        cx = self.context.console_width // 2
-        cy = self.context.console_height // 2
+        width = self.context.console_width
+        height = self.context.console_height
+        cx = width // 2
+        cy = height // 2
         
         # SIGNIFICANTLY REDUCED SIZE
         # Radius 6 means approx 13 lines tall (much better for mobile)
         radius_y = 6.5 * self.current_scale
         radius_x = radius_y * 2.2  # Aspect ratio correction
 
-        # Optimization: Scissor test (only loop relevant area)
-        min_y = int(cy - radius_y * 1.5)
-        max_y = int(cy + radius_y * 1.5)
-        min_x = int(cx - radius_x * 1.5)
-        max_x = int(cx + radius_x * 1.5)
-
-        for y in range(max(0, min_y), min(self.context.console_height, max_y)):
-            ny = (cy - y) / radius_y
-            
-            for x in range(max(0, min_x), min(self.context.console_width, max_x)):
-                nx = (x - cx) / radius_x
-                
-                # Heart Equation
-                a = nx*nx + ny*ny - 1
-                value = a*a*a - (nx*nx * ny*ny*ny)
-                
-                # Check if we are inside or on the edge
-                if value <= 0:
-                    # EDGE DETECTION
-                    # If value is close to 0, it's the outline.
-                    # If value is negative, it's the inside.
-                    
-                    if value > -0.2:
-                        # THE OUTLINE (Bright & Clean)
-                        self._set_buffer(buffer, x, y, "*", PINK, alpha)
-                    
-                    else:
-                        # THE INSIDE (Stardust Fill)
-                        # We don't fill every pixel. We leave some empty for "space"
-                        noise = self._get_noise(x, y)
-                        
-                        if noise > 0.7:
-                            # Sparse stars inside
-                            self._set_buffer(buffer, x, y, "·", PINK, alpha * 0.5)
-                        elif noise > 0.95:
-                            # Rare bright sparkles
-                            self._set_buffer(buffer, x, y, "+", WHITE, alpha * 0.8)
\ No newline at end of file
+        self._ensure_noise()
+        outline, sparse = _rasterize_heart(cx, cy, radius_x, radius_y, width, height, self.noise)
+        set_buffer = self._set_buffer
+
+        # THE OUTLINE (Bright & Clean)
+        for x, y in outline:
+            set_buffer(buffer, x, y, "*", PINK, alpha)
+
+        # THE INSIDE (Stardust Fill): sparse stars inside
+        sparse_alpha = alpha * 0.5
+        for x, y in sparse:
+            set_buffer(buffer, x, y, "·", PINK, sparse_alpha)
+
+
+@lru_cache(maxsize=1)
+def _heart_template() -> Tuple[bytes, ...]:
+    """
+    Classify the normalized heart once, at HEART_TEMPLATE_SIZE² resolution.
+
+    Returns:
+        Rows (top = +ny) of bytes over [-HEART_EXTENT, HEART_EXTENT]²,
+        each cell OUTSIDE, OUTLINE or INSIDE
+
+    The shape only changes scale with the beat, so render() samples this
+    template instead of evaluating the implicit surface per cell.
+    """
+    step = 2 * HEART_EXTENT / HEART_TEMPLATE_SIZE
+    # Sample at cell centers
+    coords = [-HEART_EXTENT + (i + 0.5) * step for i in range(HEART_TEMPLATE_SIZE)]
+    rows = []
+    for ny in reversed(coords):
+        ny2 = ny * ny
+        ny3 = ny2 * ny
+        row = bytearray(HEART_TEMPLATE_SIZE)
+        for i, nx in enumerate(coords):
+            # Heart Equation
+            nx2 = nx * nx
+            a = nx2 + ny2 - 1
+            value = a * a * a - nx2 * ny3
+            # Close to 0 (from below) is the outline; more negative is the inside
+            if value <= 0:
+                row[i] = OUTLINE if value > -0.2 else INSIDE
+        rows.append(bytes(row))
+    return tuple(rows)
+
+
+def _template_index(n: float) -> int:
+    """Template row/column for a normalized coordinate, clamped to the grid."""
+    i = int((n + HEART_EXTENT) * (HEART_TEMPLATE_SIZE / (2 * HEART_EXTENT)))
+    return min(HEART_TEMPLATE_SIZE - 1, max(0, i))
+
+
+def _rasterize_heart(cx, cy, radius_x, radius_y, width, height, noise):
+    """
+    Classify the cells of the heart's bounding box.
+
+    Args:
+        cx, cy: Heart center
+        radius_x, radius_y: Heart radii in cells
+        width, height: Console size (cells outside are skipped)
+        noise: Console-sized noise rows (noise[y][x], 0.0-1.0) for the stardust fill
+
+    Returns:
+        Tuple of (outline cells, sparse fill cells) as lists of (x, y)
+
+    Each cell is an affine lookup into the precomputed heart template:
+    template columns are computed once per frame, rows once per screen row.
+    """
+    template = _heart_template()
+
+    # Optimization: Scissor test (only loop relevant area)
+    min_y = int(cy - radius_y * HEART_EXTENT)
+    max_y = int(cy + radius_y * HEART_EXTENT)
+    min_x = int(cx - radius_x * HEART_EXTENT)
+    max_x = int(cx + radius_x * HEART_EXTENT)
+
+    xs = range(max(0, min_x), min(width, max_x))
+    columns = [_template_index((x - cx) / radius_x) for x in xs]
+    outline = []
+    sparse = []
+
+    for y in range(max(0, min_y), min(height, max_y)):
+        # Template rows run top-down from +ny
+        tpl_row = template[HEART_TEMPLATE_SIZE - 1 - _template_index((cy - y) / radius_y)]
+        noise_row = noise[y]
+
+        for x, col in zip(xs, columns):
+            cell = tpl_row[col]
+            if cell == OUTLINE:
+                outline.append((x, y))
+            # We don't fill every pixel. We leave some empty for "space"
+            # (the old "noise > 0.95" sparkle branch sat behind this
+            # test and could never fire)
+            elif cell == INSIDE and noise_row[x] > 0.7:
+                sparse.append((x, y))
+
+    return outline, sparse
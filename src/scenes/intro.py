@@ -4,6 +4,7 @@ SceneIntro for Nina's Beats.
 Black screen with typing text in hacker style.
 """
 import time
+from typing import List, Tuple
 
 from rich.color import Color
 
@@ -37,14 +38,26 @@ class SceneIntro(Scene):
         self.type_timer = 0.0
         self.pause_timer = 0.0
         self.is_pausing = False
+        self._current_len = len(self.TEXTS[0])  # Length of the line being typed
+        self.is_complete = False  # Every line typed; the scene is static from here
+        # Placements (x, y, text) of the full lines, per console size
+        self._layout: List[Tuple[int, int, str]] = []
+        self._layout_size: Tuple[int, int] = (0, 0)
 
     def enter(self) -> None:
         """Called when scene becomes active."""
-        self.current_text_index = 0
-        self.current_char_index = 0
+        self._set_line(0)
         self.type_timer = 0.0
         self.pause_timer = 0.0
         self.is_pausing = False
+        self.is_complete = False
+
+    def _set_line(self, index: int) -> None:
+        """Start typing line `index`, caching its length."""
+        self.current_text_index = index
+        self.current_char_index = 0
+        if index < len(self.TEXTS):
+            self._current_len = len(self.TEXTS[index])
 
     def exit(self) -> None:
         """Called when scene becomes inactive."""
@@ -59,7 +72,7 @@ class SceneIntro(Scene):
             context: Current scene context
         """
         # Check if all texts complete
-        if self.current_text_index >= len(self.TEXTS):
+        if self.is_complete or self.current_text_index >= len(self.TEXTS):
             return
 
         # If we're pausing between lines
@@ -67,8 +80,7 @@ class SceneIntro(Scene):
             self.pause_timer += dt
             if self.pause_timer >= self.PAUSE_BETWEEN_LINES:
                 # Move to next line
-                self.current_text_index += 1
-                self.current_char_index = 0
+                self._set_line(self.current_text_index + 1)
                 self.is_pausing = False
                 self.pause_timer = 0.0
             return
@@ -85,10 +97,12 @@ class SceneIntro(Scene):
             self.current_char_index += 1
 
             # Check if current text is complete
-            if self.current_char_index >= len(self.TEXTS[self.current_text_index]):
+            if self.current_char_index >= self._current_len:
                 # Start pause before next line
                 if self.current_text_index < len(self.TEXTS) - 1:
                     self.is_pausing = True
+                else:
+                    self.is_complete = True
 
     def render(self, buffer, alpha: float = 1.0) -> None:
         """
@@ -98,25 +112,41 @@ class SceneIntro(Scene):
             buffer: FrameBuffer to render into
             alpha: Opacity 0.0-1.0 for fade
         """
-        # Calculate vertical centering
-        total_lines = len(self.TEXTS)
-        start_y = (self.context.console_height - total_lines) // 2
-        start_y = max(2, start_y)  # At least 2 lines from top
+        width = self.context.console_width
+        height = self.context.console_height
+        if self._layout_size != (width, height):
+            self._layout = self._layout_lines(width, height)
+            self._layout_size = (width, height)
+
+        # Lines typed so far; the current one is cut to its typed prefix but
+        # keeps the full line's x, so it does not shift while typing
+        style = self._dimmed_style(PINK, alpha)
+        current = self.current_text_index
+        for i, (x, y, text) in enumerate(self._layout):
+            if i > current:
+                break
+            if i == current:
+                text = text[:self.current_char_index]
+            buffer.set_text(x, y, text, style)
 
-        # Render each text line
+    def _layout_lines(self, width: int, height: int) -> List[Tuple[int, int, str]]:
+        """
+        Placements of every fully typed line.
+
+        Args:
+            width: Console width
+            height: Console height
+
+        Returns:
+            List of (x, y, text): lines vertically centered (at least 2 rows
+            from the top) with a blank row between them, each centered by x
+            offset; lines past the bottom are dropped
+        """
+        start_y = max(2, (height - len(self.TEXTS)) // 2)
+        lines = []
         for i, text in enumerate(self.TEXTS):
-            y = start_y + i * 2  # Add spacing between lines
-            if y >= self.context.console_height:
+            y = start_y + i * 2
+            if y >= height:
                 break
-
-            if i < self.current_text_index:
-                # Previous texts - show complete
-                centered = self._center_text(text, self.context.console_width)
-                self._set_text_buffer(buffer, 0, y, centered, PINK, alpha)
-            elif i == self.current_text_index:
-                # Current text - show partial
-                chars_to_show = min(self.current_char_index, len(text))
-                partial = text[:chars_to_show]
-                # Center the partial text
-                x = (self.context.console_width - len(text)) // 2
-                self._set_text_buffer(buffer, x, y, partial, PINK, alpha)
+            lines.append(((width - len(text)) // 2, y, text))
+        return lines
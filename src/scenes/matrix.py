@@ -5,11 +5,17 @@ Tech/Cool scene with digital rain using hearts/flowers instead of numbers.
 Green → Pink color transition over time.
 """
 import random
+from typing import List
 
 from rich.color import Color
 
 from .base import Scene, SceneContext
-from ..colors import PINK, BLUE
+from ..colors import ALPHA_LEVELS, PINK, BLUE
+
+
+RAIN_CHARS = ["♥", "✿", "❀", "❁"]
+FADE_PER_FRAME = 0.98  # Brightness kept per update as characters fall
+MIN_BRIGHTNESS = 0.05  # Characters at or below this are dropped
 
 
 class RainColumn:
@@ -19,7 +25,9 @@ class RainColumn:
         """Initialize rain column."""
         self.x = x
         self.max_height = max_height
-        self.chars = []  # List of (char, brightness) tuples
+        # Parallel lists, oldest (dimmest) first
+        self.glyphs: List[str] = []
+        self.bright: List[float] = []
         self.speed = random.uniform(3, 8)  # Falling speed
         self.spawn_timer = 0
         self.brightness = 1.0  # For color transition
@@ -30,19 +38,24 @@ class RainColumn:
 
         # Spawn new character at top
         if self.spawn_timer <= 0:
-            self.chars.append((random.choice(["♥", "✿", "❀", "❁"]), 1.0))
+            self.glyphs.append(random.choice(RAIN_CHARS))
+            self.bright.append(1.0)
             self.spawn_timer = random.uniform(0.1, 0.3)
 
         # Update character brightness (fade out as they fall)
-        for i in range(len(self.chars)):
-            self.chars[i] = (self.chars[i][0], self.chars[i][1] * 0.98)
+        bright = [b * FADE_PER_FRAME for b in self.bright]
+        self.bright = bright
 
-        # Remove faded characters
-        self.chars = [c for c in self.chars if c[1] > 0.05]
-
-        # Move characters down
-        if len(self.chars) > self.max_height:
-            self.chars.pop(0)
+        # Remove faded characters: every character fades at the same rate,
+        # so the faded ones are always a prefix of the (oldest-first) lists
+        faded = 0
+        while faded < len(bright) and bright[faded] <= MIN_BRIGHTNESS:
+            faded += 1
+        # Move characters down (drop the oldest past the column height)
+        faded = max(faded, len(bright) - self.max_height)
+        if faded > 0:
+            del self.glyphs[:faded]
+            del bright[:faded]
 
 
 class SceneMatrixRain(Scene):
@@ -120,11 +133,15 @@ class SceneMatrixRain(Scene):
         b = int(0 * (1 - self.color_progress) + 180 * self.color_progress)
         base_color = Color.from_rgb(r, g, b)
 
+        # One style per brightness step for this frame, with alpha folded in
+        styles = [self._dimmed_style(base_color, alpha * level / ALPHA_LEVELS) for level in range(ALPHA_LEVELS + 1)]
+
         # Render each column
+        height = self.context.console_height
         for column in self.columns:
-            for y, (char, brightness) in enumerate(reversed(column.chars)):
-                screen_y = self.context.console_height - 1 - y
-                if 0 <= screen_y < self.context.console_height:
-                    # Apply brightness to color
-                    char_color = self._apply_alpha(base_color, alpha * brightness)
-                    self._set_buffer(buffer, column.x, screen_y, char, char_color)
+            for y, (char, brightness) in enumerate(zip(reversed(column.glyphs), reversed(column.bright))):
+                screen_y = height - 1 - y
+                if screen_y < 0:
+                    break  # Rows only go further up from here
+                # Apply brightness to color
+                buffer.set(column.x, screen_y, char, styles[int(brightness * ALPHA_LEVELS)])
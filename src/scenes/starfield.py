@@ -4,30 +4,21 @@ SceneStarfield for Nina's Beats.
 Dreamy scene with 3D starfield moving toward camera (warp effect).
 """
 import random
+from typing import List, Tuple
 from rich.color import Color
 
 from .base import Scene, SceneContext
 from ..colors import BLUE, WHITE
 
 
-class Star:
-    """A single star in 3D space."""
+MAX_DEPTH = 100.0  # Far plane; stars respawn here after passing the camera
+DEPTH_BUCKET = 20.0  # Depth range sharing one character/color
+PROJECTION_SCALE = 50.0  # Perspective focal length
 
-    def __init__(self, max_depth: float = 100.0):
-        """Initialize star with random 3D position."""
-        self.x = random.uniform(-50, 50)
-        self.y = random.uniform(-25, 25)
-        self.z = random.uniform(1, max_depth)
-        self.max_depth = max_depth
 
-    def update(self, speed: float) -> None:
-        """Move star toward camera (decrease z)."""
-        self.z -= speed
-        if self.z <= 1:
-            # Reset star to back
-            self.z = self.max_depth
-            self.x = random.uniform(-50, 50)
-            self.y = random.uniform(-25, 25)
+def _spawn_xy() -> Tuple[float, float]:
+    """Random star x, y in 3D space."""
+    return random.uniform(-50, 50), random.uniform(-25, 25)
 
 
 class SceneStarfield(Scene):
@@ -42,8 +33,23 @@ class SceneStarfield(Scene):
     def __init__(self, context: SceneContext):
         """Initialize Starfield scene."""
         super().__init__(context)
-        self.stars = [Star() for _ in range(self.NUM_STARS)]
+        # Stars as parallel coordinate lists (structure-of-arrays)
+        self.star_x: List[float] = []
+        self.star_y: List[float] = []
+        self.star_z: List[float] = []
+        for _ in range(self.NUM_STARS):
+            x, y = _spawn_xy()
+            self.star_x.append(x)
+            self.star_y.append(y)
+            self.star_z.append(random.uniform(1, MAX_DEPTH))
         self.speed = 5.0
+        # (char, color) per depth bucket, covering z up to MAX_DEPTH inclusive:
+        # closer = brighter char; white for close stars, blue for distant
+        num_buckets = int(MAX_DEPTH / DEPTH_BUCKET) + 1
+        self._depth_lut: List[Tuple[str, Color]] = [
+            (self.STAR_CHARS[min(len(self.STAR_CHARS) - 1, i)], WHITE if i == 0 else BLUE)
+            for i in range(num_buckets)
+        ]
 
     def enter(self) -> None:
         """Called when scene becomes active."""
@@ -64,8 +70,16 @@ class SceneStarfield(Scene):
         # Speed increases with beat intensity
         current_speed = self.speed * (1 + context.beat_intensity * 2)
 
-        for star in self.stars:
-            star.update(current_speed * dt)
+        # Move every star toward the camera (decrease z)
+        step = current_speed * dt
+        zs = [z - step for z in self.star_z]
+        self.star_z = zs
+        if min(zs) <= 1:
+            # Reset passed stars to the back
+            for i, z in enumerate(zs):
+                if z <= 1:
+                    zs[i] = MAX_DEPTH
+                    self.star_x[i], self.star_y[i] = _spawn_xy()
 
     def render(self, buffer, alpha: float = 1.0) -> None:
         """
@@ -75,24 +89,24 @@ class SceneStarfield(Scene):
             buffer: FrameBuffer to render into
             alpha: Opacity 0.0-1.0 for fade
         """
-        cx = self.context.console_width / 2
-        cy = self.context.console_height / 2
-
-        for star in self.stars:
+        width = self.context.console_width
+        height = self.context.console_height
+        cx = width / 2
+        cy = height / 2
+        depth_lut = self._depth_lut
+        set_buffer = self._set_buffer
+
+        for x, y, z in zip(self.star_x, self.star_y, self.star_z):
             # Perspective projection
-            if star.z <= 0:
+            if z <= 0:
                 continue
 
-            scale = 50 / star.z
-            screen_x = int(cx + star.x * scale)
-            screen_y = int(cy + star.y * scale)
+            scale = PROJECTION_SCALE / z
+            screen_x = int(cx + x * scale)
+            screen_y = int(cy + y * scale)
 
             # Check bounds
-            if 0 <= screen_x < self.context.console_width and 0 <= screen_y < self.context.console_height:
-                # Choose character based on depth (closer = brighter)
-                depth_idx = min(len(self.STAR_CHARS) - 1, int(star.z / 20))
-                char = self.STAR_CHARS[depth_idx]
-
-                # Color: white for close stars, blue for distant
-                color = WHITE if star.z < 20 else BLUE
-                self._set_buffer(buffer, screen_x, screen_y, char, color, alpha)
+            if 0 <= screen_x < width and 0 <= screen_y < height:
+                # Character and color by depth bucket
+                char, color = depth_lut[int(z / DEPTH_BUCKET)]
+                set_buffer(buffer, screen_x, screen_y, char, color, alpha)
@@ -4,10 +4,22 @@ SceneWaveform for Nina's Beats.
 Energetic scene with vertical bars at screen bottom.
 """
 import math
+from array import array
+from functools import lru_cache
+from typing import Tuple
 from rich.color import Color
 
 from .base import Scene, SceneContext
-from ..colors import get_gradient_color
+from ..colors import bar_phases, get_gradient_color_at
+
+TWO_PI = 2 * math.pi
+
+
+@lru_cache(maxsize=16)
+def _phase_trig(num_bars: int) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """cos and sin of each bar's phase offset i * 0.3 (cached per bar count)."""
+    phases = bar_phases(num_bars, 0.3)
+    return tuple(math.cos(p) for p in phases), tuple(math.sin(p) for p in phases)
 
 
 class SceneWaveform(Scene):
@@ -21,15 +33,18 @@ class SceneWaveform(Scene):
     def __init__(self, context: SceneContext):
         """Initialize Waveform scene."""
         super().__init__(context)
-        self.bar_heights = []
+        # Bar heights as 0-255 fixed point (255 = full height), one byte each
+        self.bar_heights = array('B')
+        # cos/sin of each bar's phase step (i * 0.3), rebuilt with the bars
+        self._phase_cos = []
+        self._phase_sin = []
         self.offset = 0.0
         self.num_bars = 40  # Will be adjusted based on width
-        self.last_width = 0
+        self.last_width = 0  # Console width the bar count was last checked at
 
     def enter(self) -> None:
         """Called when scene becomes active."""
         self.offset = 0.0
-        self.last_width = self.context.console_width
         self._ensure_bars()
 
     def exit(self) -> None:
@@ -39,12 +54,18 @@ class SceneWaveform(Scene):
     def _ensure_bars(self) -> None:
         """Ensure bar heights array exists for current width."""
         current_width = self.context.console_width
+        # Nothing to recompute on the usual frame where the width is unchanged
+        if current_width == self.last_width and self.bar_heights:
+            return
+        self.last_width = current_width
+
         # Calculate optimal number of bars (one per ~3 columns)
         target_bars = max(20, current_width // 3)
 
         if abs(target_bars - self.num_bars) > 5 or not self.bar_heights:
             self.num_bars = target_bars
-            self.bar_heights = [0.0] * self.num_bars
+            self.bar_heights = array('B', bytes(self.num_bars))
+            self._phase_cos, self._phase_sin = _phase_trig(self.num_bars)
 
     def update(self, dt: float, context: SceneContext) -> None:
         """
@@ -55,18 +76,22 @@ class SceneWaveform(Scene):
             context: Current scene context
         """
         self._ensure_bars()
-        self.offset += dt * 3
-
-        for i in range(self.num_bars):
-            # Generate wave pattern
-            wave = math.sin(self.offset + i * 0.3)
-            wave = (wave + 1) / 2  # Normalize to 0-1
-
-            # Modulate with beat intensity
-            height = wave * (0.3 + context.beat_intensity * 0.7)
-
-            # Smooth transition
-            self.bar_heights[i] = self.bar_heights[i] * 0.8 + height * 0.2
+        # Wrapped to one period so the trig arguments stay small and precise
+        self.offset = (self.offset + dt * 3) % TWO_PI
+
+        # One comprehension over all bars: the normalized wave (sin + 1) / 2,
+        # scaled by the beat and blended 20% into the old height.
+        # sin(offset + i * 0.3) is expanded by the angle-addition identity, so
+        # the frame costs two trig calls instead of one per bar.
+        # Heights are 0-255 fixed point; the blend is (old * 205 + new * 51 + 128) >> 8
+        # (~0.8/0.2), with the new height's 255 scale and 51 weight in the gain.
+        sin_o = math.sin(self.offset)
+        cos_o = math.cos(self.offset)
+        gain = (0.3 + context.beat_intensity * 0.7) * (0.5 * 255 * 51)
+        self.bar_heights = array('B', [
+            (height * 205 + int((sin_o * pc + cos_o * ps + 1.0) * gain) + 128) >> 8
+            for height, pc, ps in zip(self.bar_heights, self._phase_cos, self._phase_sin)
+        ])
 
     def render(self, buffer, alpha: float = 1.0) -> None:
         """
@@ -76,25 +101,34 @@ class SceneWaveform(Scene):
             buffer: FrameBuffer to render into
             alpha: Opacity 0.0-1.0 for fade
         """
-        max_height = self.context.console_height // 2
-        bar_width = max(1, self.context.console_width // self.num_bars)
+        width = self.context.console_width
+        console_height = self.context.console_height
+        num_bars = self.num_bars
+        blocks = self.BLOCK_CHARS
+        fill_rect = buffer.fill_rect
+        max_height = console_height // 2
+        bar_width = max(1, width // num_bars)
+        bottom = console_height - 2
+
+        # Row range of each block character: block k covers the rows y with
+        # (y * 9) // max_height == k, i.e. from ceil(k * max_height / 9)
+        bounds = [(k * max_height + 8) // 9 for k in range(10)]
+        bands = [(bounds[k], bounds[k + 1], blocks[k]) for k in range(9) if bounds[k] < bounds[k + 1]]
 
         # Render bars from bottom up
         for i, height in enumerate(self.bar_heights):
-            bar_height = int(height * max_height)
-            x = (i * self.context.console_width) // self.num_bars
-
-            for y in range(bar_height):
-                screen_y = self.context.console_height - 2 - y
-                if screen_y >= 0:
-                    # Get color based on height/intensity
-                    color = get_gradient_color(height)
-
-                    # Choose block character
-                    block_idx = min(8, int((y / max_height) * 9))
-                    char = self.BLOCK_CHARS[block_idx]
-
-                    # Fill bar width
-                    for dx in range(bar_width):
-                        if x + dx < self.context.console_width:
-                            self._set_buffer(buffer, x + dx, screen_y, char, color, alpha)
+            # Rows that land on screen (screen_y = bottom - y >= 0)
+            bar_height = min((height * max_height) // 255, bottom + 1)
+            if bar_height <= 0:
+                continue
+            x = (i * width) // num_bars
+            bar_cols = min(bar_width, width - x)
+            # Style based on height/intensity, constant for the whole bar
+            style = self._dimmed_style(get_gradient_color_at(height), alpha)
+
+            # One rectangle per block band the bar reaches
+            for start, end, char in bands:
+                if start >= bar_height:
+                    break
+                end = min(end, bar_height)
+                fill_rect(x, bottom - end + 1, bar_cols, end - start, char, style)
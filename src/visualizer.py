@@ -4,24 +4,112 @@ Audio spectrum visualizer for Nina's Beats.
 Simulated beat reactor that generates convincing audio-reactive bars
 without the latency of real FFT.
 """
-import math
 import random
 import time
+from array import array
+from functools import lru_cache
 from rich.color import Color
-from typing import List
+from typing import Optional, Tuple
 
-from .colors import get_gradient_color
+from .colors import bar_phases, get_gradient_color
 
 
 # Unicode block characters for smooth bars
 BLOCK_CHARS = " ▂▃▄▅▆▇█"
 
+# Bars are drawn 3 rows high
+VISUALIZER_ROWS = 3
+
+
+# BLOCK_CHARS index drawn on each row (top first) for each block level 0-8:
+# row r draws a bar whose level is above r * 3, clamped to 1-7
+_LEVEL_ROWS = tuple(
+    tuple(min(7, level - row * 3) if level > row * 3 else 0 for row in range(VISUALIZER_ROWS))
+    for level in range(9)
+)
+
+
+@lru_cache(maxsize=16)
+def _level_cells(bar_width: int) -> tuple:
+    """Per block level, each row's character repeated to bar width (cached per width)."""
+    return tuple(
+        tuple(BLOCK_CHARS[index] * bar_width for index in indices)
+        for indices in _LEVEL_ROWS
+    )
+
+
+def _jenkins_hash(key: int) -> int:
+    """Jenkins one-at-a-time style integer hash, masked to 32 bits."""
+    h = key & 0xFFFFFFFF
+    h = (h + (h << 10)) & 0xFFFFFFFF
+    h ^= h >> 6
+    h = (h + (h << 3)) & 0xFFFFFFFF
+    h ^= h >> 11
+    h = (h + (h << 15)) & 0xFFFFFFFF
+    return h
+
+
+# Value-noise lattice: one hashed 0.0-1.0 value per integer point, built once
+# at import. The mask wraps lattice coordinates (repeats after ~30 min at 2/s).
+_LATTICE_MASK = 4095
+_LATTICE = tuple((_jenkins_hash(k) & 0xFFFF) / 65535 for k in range(_LATTICE_MASK + 1))
+# Step from each lattice point to the next (wrapping), so a sample needs one
+# lookup per table instead of two lattice reads
+_LATTICE_DELTA = tuple(_LATTICE[(k + 1) & _LATTICE_MASK] - _LATTICE[k] for k in range(_LATTICE_MASK + 1))
+# Lattice shift for the second octave so it does not track the first
+_OCTAVE2_SHIFT = 2048
+# Noise offset wrap: a whole number of lattice periods for both octaves
+# (octave 2 advances 2.3x as fast), so wrapping is seamless
+_NOISE_PERIOD = (_LATTICE_MASK + 1) * 10.0
+
+# Block level (0-8) for each 0-255 bar height, as a bytes.translate() table
+_LEVEL_TABLE = bytes((height * 8) // 255 for height in range(256))
+
+
+def _spectrum_step(
+    heights: array,
+    phase_a: Tuple[float, ...],
+    phase_b: Tuple[float, ...],
+    o1: float,
+    o2: float,
+    gain: float
+) -> array:
+    """
+    Noise kernel: next 0-255 bar heights from two octaves of value noise.
+
+    Each octave samples the lattice at offset + the bar's phase step and
+    smoothsteps toward the next point; octave 2 is weighted 0.5. The sum is
+    blended into the old height as (old * 179 + n * gain + 128) >> 8.
+    Tables and inputs are locals and the bars are read through one zip().
+
+    Returns:
+        New array of bar heights
+    """
+    lattice = _LATTICE
+    delta = _LATTICE_DELTA
+    mask = _LATTICE_MASK
+    out = array('B')
+    append = out.append
+    for height, pa, pb in zip(heights, phase_a, phase_b):
+        t = o1 + pa
+        t0 = int(t)
+        f = t - t0
+        k = t0 & mask
+        n = lattice[k] + delta[k] * (f * f * (3.0 - 2.0 * f))
+        t = o2 + pb
+        t0 = int(t)
+        f = t - t0
+        k = t0 & mask
+        n += (lattice[k] + delta[k] * (f * f * (3.0 - 2.0 * f))) * 0.5
+        append((height * 179 + int(n * gain) + 128) >> 8)
+    return out
+
 
 class SpectrumVisualizer:
     """
     Simulated beat reactor for audio visualization.
 
-    Uses Perlin-like noise + scene intensity to generate convincing
+    Uses hashed value noise + scene intensity to generate convincing
     bar movements without audio latency.
     """
 
@@ -34,7 +122,14 @@ class SpectrumVisualizer:
         """
         self.num_bars = num_bars
         self.offset = random.random() * 100  # Random offset for noise variation
-        self.bar_heights: List[float] = [0.0] * num_bars
+        # Bar heights as 0-255 fixed point (255 = full height), one byte each
+        self.bar_heights = array('B', bytes(num_bars))
+        # Per-bar phase steps of the two noise octaves (fixed for num_bars)
+        self._phase_a = bar_phases(num_bars, 0.3)
+        self._phase_b = bar_phases(num_bars, 1.1)
+        # Last built rows, keyed by (bar_width, per-bar block levels)
+        self._rows_key: Optional[Tuple[int, bytes]] = None
+        self._rows_cache: Tuple[str, ...] = ()
 
     def update(self, dt: float, beat_intensity: float) -> None:
         """
@@ -44,24 +139,43 @@ class SpectrumVisualizer:
             dt: Delta time in seconds
             beat_intensity: 0.0-1.0 intensity from scene
         """
-        self.offset += dt * 2  # Animate noise
-
-        for i in range(self.num_bars):
-            # Generate Perlin-like noise
-            noise = (math.sin(self.offset + i * 0.3) +
-                     math.sin(self.offset * 1.5 + i * 0.7) * 0.5 +
-                     math.sin(self.offset * 2.3 + i * 1.1) * 0.25)
+        self.offset = (self.offset + dt * 2) % _NOISE_PERIOD  # Animate noise
+
+        # Higher intensity = more pronounced peaks. The ~30% blend weight (77
+        # of 256), 255 scale and 1 / 1.5 octave normalization fold into gain.
+        o1 = self.offset
+        gain = (0.3 + beat_intensity * 0.7) * (255 * 77 / 1.5)
+        self.bar_heights = _spectrum_step(
+            self.bar_heights, self._phase_a, self._phase_b,
+            o1, o1 * 2.3 + _OCTAVE2_SHIFT, gain
+        )
+
+    def _rows(self, bar_width: int) -> Tuple[str, ...]:
+        """
+        Build the VISUALIZER_ROWS lines of bars in a single pass over the bars.
 
-            # Normalize to 0-1
-            noise = (noise + 1.75) / 3.5
-            noise = max(0, min(1, noise))
+        Each bar's block level (0-8) picks its cell on every row from the
+        _LEVEL_ROWS table. Smoothed heights often quantize to the same levels
+        frame to frame, so the last rows are reused while the levels and bar
+        width are unchanged.
 
-            # Combine with beat intensity
-            # Higher intensity = more pronounced peaks
-            energy = noise * (0.3 + beat_intensity * 0.7)
+        Args:
+            bar_width: Columns per bar
 
-            # Smooth transition from previous height
-            self.bar_heights[i] = self.bar_heights[i] * 0.7 + energy * 0.3
+        Returns:
+            One string per row, top first
+        """
+        levels = self.bar_heights.tobytes().translate(_LEVEL_TABLE)
+        key = (bar_width, levels)
+        if key == self._rows_key:
+            return self._rows_cache
+
+        table = _level_cells(bar_width)
+        # One table lookup per bar, then transpose bar columns into rows
+        rows = tuple("".join(row) for row in zip(*[table[level] for level in levels]))
+        self._rows_key = key
+        self._rows_cache = rows
+        return rows
 
     def render(self, width: int) -> str:
         """
@@ -75,31 +189,25 @@ class SpectrumVisualizer:
         """
         # Calculate bar width - use full width
         bar_width = max(2, width // self.num_bars)
+        return '\n'.join(self._rows(bar_width))
+
+    def render_into(self, buffer, x: int, y: int, style: str = "") -> None:
+        """
+        Render the visualizer straight into a FrameBuffer.
 
-        # Use 3 rows for height
-        result = []
-
-        # Create 3 rows of unicode blocks
-        for row in range(3):  # 3 rows high
-            line_parts = []
-            for i in range(self.num_bars):
-                height = self.bar_heights[i]
-                # Convert to block level (0-7)
-                level = int(height * 8)
-                if level > 0:
-                    # Determine which character to use
-                    char_index = min(7, max(1, level - row * 3))
-                    if row * 3 < level:
-                        char = BLOCK_CHARS[char_index]
-                    else:
-                        char = ' '
-                else:
-                    char = ' '
-                line_parts.append(char * bar_width)
-
-            result.append(''.join(line_parts))
-
-        return '\n'.join(result)
+        Produces the same rows as render(buffer.width), but writes each row
+        with one set_text() call instead of joining and re-splitting a
+        multi-line string.
+
+        Args:
+            buffer: FrameBuffer to draw into
+            x: Starting column
+            y: Top row of the visualizer (it occupies VISUALIZER_ROWS rows)
+            style: Rich style string for the bars
+        """
+        bar_width = max(2, buffer.width // self.num_bars)
+        for row, line in enumerate(self._rows(bar_width)):
+            buffer.set_text(x, y + row, line, style)
 
     def get_bar_color(self, bar_index: int, height: float) -> Color:
         """
@@ -0,0 +1,52 @@
+"""Tests for AudioManager playback-clock tracking."""
+from pathlib import Path
+
+from src.audio_manager import AudioManager
+
+
+class StubPlayer:
+    """Stands in for an mpv.MPV player; only time_pos is read."""
+
+    def __init__(self):
+        self.time_pos = None
+
+
+def make_manager() -> AudioManager:
+    manager = AudioManager(Path("assets/audio.mp3"))
+    manager.player = StubPlayer()
+    return manager
+
+
+def test_time_is_zero_before_playback_starts():
+    manager = make_manager()
+    assert manager.get_time(now_ns=1_000_000_000) == 0.0
+
+
+def test_time_follows_decoder_position():
+    manager = make_manager()
+    manager.player.time_pos = 12.25
+    assert manager.get_time(now_ns=1_000_000_000) == 12.25
+
+
+def test_time_does_not_go_backwards_after_eof():
+    manager = make_manager()
+    manager.player.time_pos = 79.5
+    assert manager.get_time(now_ns=1_000_000_000) == 79.5
+
+    # libmpv goes idle at EOF and time_pos becomes None
+    manager.player.time_pos = None
+    after_eof = manager.get_time(now_ns=1_500_000_000)
+    assert after_eof == 80.0
+    later = manager.get_time(now_ns=6_500_000_000)
+    assert later == 85.0  # Keeps running past the finale exit threshold
+
+
+def test_time_is_frozen_while_paused_after_eof():
+    manager = make_manager()
+    manager.player.time_pos = 79.5
+    manager.get_time(now_ns=1_000_000_000)
+    manager.player.time_pos = None
+    manager.state.is_paused = True
+    assert manager.get_time(now_ns=3_000_000_000) == 79.5
+    manager.state.is_paused = False
+    assert manager.get_time(now_ns=4_000_000_000) == 80.5
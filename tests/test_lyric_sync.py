@@ -0,0 +1,73 @@
+"""Tests for LyricMap playback-cursor lookups."""
+from src.lyric_sync import LyricEntry, LyricMap
+
+
+def make_map() -> LyricMap:
+    return LyricMap([
+        LyricEntry(time=0.0, text="", scene="intro"),
+        LyricEntry(time=5.0, text="first line", scene=None),
+        LyricEntry(time=10.0, text="", scene="starfield"),
+        LyricEntry(time=12.0, text="second line", scene="fireworks"),
+        LyricEntry(time=20.0, text="third line", scene=None),
+    ])
+
+
+def test_trigger_fires_when_crossed():
+    lyrics = make_map()
+    assert lyrics.get_scene_trigger(0.0) == "intro"
+    assert lyrics.get_scene_trigger(9.9) is None
+    assert lyrics.get_scene_trigger(10.0) == "starfield"
+
+
+def test_several_triggers_crossed_most_recent_wins():
+    lyrics = make_map()
+    assert lyrics.get_scene_trigger(15.0) == "fireworks"
+
+
+def test_repeated_time_does_not_refire():
+    lyrics = make_map()
+    assert lyrics.get_scene_trigger(10.0) == "starfield"
+    assert lyrics.get_scene_trigger(10.0) is None
+    assert lyrics.get_scene_trigger(11.0) is None
+
+
+def test_reset_lets_triggers_fire_again():
+    lyrics = make_map()
+    assert lyrics.get_scene_trigger(15.0) == "fireworks"
+    lyrics.reset()
+    assert lyrics.get_scene_trigger(0.0) == "intro"
+    assert lyrics.get_scene_trigger(10.0) == "starfield"
+
+
+def test_advance_returns_active_lyric_and_trigger():
+    lyrics = make_map()
+    lyric, scene = lyrics.advance(12.5)
+    assert lyric.text == "second line"
+    assert scene == "fireworks"
+    lyric, scene = lyrics.advance(13.0)
+    assert lyric.text == "second line"
+    assert scene is None
+
+
+def test_advance_and_get_scene_trigger_share_the_cursor():
+    lyrics = make_map()
+    assert lyrics.get_scene_trigger(0.0) == "intro"
+    lyric, scene = lyrics.advance(1.0)
+    assert lyric.scene == "intro"
+    assert scene is None
+
+
+def test_backward_time_resyncs_lyric_without_firing():
+    lyrics = make_map()
+    lyrics.advance(21.0)
+    lyric, scene = lyrics.advance(6.0)
+    assert lyric == lyrics.get_lyric_at(6.0)
+    assert scene is None
+    # Crossing a trigger again after the rewind fires it again
+    assert lyrics.get_scene_trigger(10.0) == "starfield"
+
+
+def test_before_first_entry():
+    lyrics = LyricMap([LyricEntry(time=2.0, text="late", scene="intro")])
+    assert lyrics.advance(1.0) == (None, None)
+    assert lyrics.get_lyric_at(1.0) is None